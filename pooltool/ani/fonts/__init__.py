@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 
 from pooltool.ani.globals import Global
@@ -9,7 +10,9 @@ DEFAULT = "HackNerdFontMono-Regular"
 assert DEFAULT in font_paths, f"{DEFAULT=} is missing"
 
 
+@cache
 def load_font(name: str | None = None):
+    """Load a font by name, reusing the instance on repeated calls."""
     if name is None:
         name = DEFAULT
 
@@ -1,15 +1,25 @@
+from __future__ import annotations
+
 import sys
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from pooltool.ani.globals import Global
 from pooltool.ani.menu._datatypes import BaseMenu
 
+if TYPE_CHECKING:
+    from pooltool.multiplayer import MultiplayerClient
+
 
 class MenuRegistry:
     _menus: dict[str, type[BaseMenu]] = {}
     _menu_instances: dict[str, BaseMenu] = {}
     _current_menu: BaseMenu | None = None
 
+    # Multiplayer connection shared by the multiplayer menus, so navigating between
+    # them doesn't tear down and re-establish the TCP connection
+    shared_client: MultiplayerClient | None = None
+
     @classmethod
     def register(cls, menu_class: type[BaseMenu]) -> None:
         cls._menus[menu_class.name] = menu_class
@@ -3,10 +3,20 @@
 
 from __future__ import annotations
 
+import atexit
+import importlib.util
+import logging
+import re
 import socket
 import subprocess
 import sys
 import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Final
 
 from direct.gui.DirectGui import (
     DGG,
@@ -15,7 +25,7 @@ from direct.gui.DirectGui import (
     DirectFrame,
     DirectLabel,
 )
-from panda3d.core import TextNode
+from panda3d.core import NodePath, TextNode
 
 from pooltool.ani.fonts import load_font
 from pooltool.ani.globals import Global
@@ -28,9 +38,39 @@ from pooltool.ani.menu._datatypes import (
     TEXT_COLOR,
     TITLE_FONT,
 )
-from pooltool.ani.menu._registry import MenuNavigator
+from pooltool.ani.menu._registry import MenuNavigator, MenuRegistry
 from pooltool.multiplayer import MultiplayerClient
-from pooltool.multiplayer.protocol import RoomInfo
+from pooltool.multiplayer.protocol import PlayerInfo, RoomInfo
+
+logger = logging.getLogger(__name__)
+
+# pyngrok pulls in requests and yaml and reads its config on first import, so it's
+# only located here. The import itself happens in `prefetch_pyngrok`, which the splash
+# screen runs in the background, or at the latest on the first "Host Game" click.
+_PYNGROK_AVAILABLE = importlib.util.find_spec("pyngrok") is not None
+
+_ngrok: Any = None
+_ngrok_lock = threading.Lock()
+
+
+def prefetch_pyngrok() -> None:
+    """Import pyngrok, if installed, so starting a tunnel doesn't pay for it.
+
+    Safe to call from any thread, and a no-op after the first call.
+    """
+    global _ngrok
+
+    if not _PYNGROK_AVAILABLE or _ngrok is not None:
+        return
+
+    with _ngrok_lock:
+        if _ngrok is None:
+            try:
+                from pyngrok import ngrok
+            except ImportError:
+                return
+            _ngrok = ngrok
+
 
 def copy_to_clipboard(text: str) -> bool:
     """Copy text to clipboard. Returns True if successful."""
@@ -54,16 +94,290 @@ def copy_to_clipboard(text: str) -> bool:
         return False
 
 
+# Options shared by every label in these menus. Individual labels override them via
+# `_mk_label`'s keyword arguments.
+_LABEL_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {"relief": None, "text_align": TextNode.ACenter}
+)
+
+
+# Widget palette and geometry shared across the multiplayer menus
+_STATUS_IDLE: Final = (0.7, 0.7, 0.7, 1)  # Neutral status and header text
+_STATUS_PENDING: Final = (0.8, 0.8, 0.3, 1)  # Something is in progress
+_STATUS_OK: Final = (0.3, 0.8, 0.3, 1)  # Success, and the host section's accent
+_STATUS_ERROR: Final = (0.8, 0.3, 0.3, 1)  # Failure
+_SHARE_TEXT_COLOR: Final = (0.3, 0.9, 0.3, 1)  # Addresses to share, and ready players
+_LAN_SHARE_TEXT_COLOR: Final = (0.9, 0.7, 0.3, 1)  # LAN-only address to share
+_PUBLIC_MODE_COLOR: Final = (0.5, 0.8, 0.5, 1)  # "(Internet)" under the address
+_LAN_MODE_COLOR: Final = (0.6, 0.5, 0.3, 1)  # "(LAN only)" under the address
+_WARNING_COLOR: Final = (0.8, 0.5, 0.3, 1)  # Recoverable problems, e.g. no rooms
+_LOBBY_ERROR_COLOR: Final = (0.9, 0.3, 0.3, 1)  # Errors shown in the lobby
+_OWN_NAME_COLOR: Final = (0.9, 0.9, 0.9, 1)  # Your own entry in the player list
+_MUTED_TEXT_COLOR: Final = (0.6, 0.6, 0.6, 1)  # Section descriptions
+_DIM_TEXT_COLOR: Final = (0.5, 0.5, 0.5, 1)  # Your IP, placeholders, unready players
+_JOIN_ACCENT_COLOR: Final = (0.3, 0.6, 0.9, 1)  # The join section's title
+_GUEST_BANNER_COLOR: Final = (0.3, 0.8, 0.9, 1)  # "Connected to host's game"
+_ENTRY_FRAME_COLOR: Final = (1, 1, 1, 0.9)  # Address entry backdrop
+_ENTRY_TEXT_COLOR: Final = (0, 0, 0, 1)  # Address entry text
+_HOST_BUTTON_COLOR: Final = (0.2, 0.6, 0.2, 1)
+_JOIN_BUTTON_COLOR: Final = (0.2, 0.4, 0.7, 1)
+_READY_BUTTON_COLOR: Final = (0.2, 0.7, 0.2, 1)  # Also the copy button once copied
+_UNREADY_BUTTON_COLOR: Final = (0.7, 0.3, 0.3, 1)
+_START_BUTTON_COLOR: Final = (0.8, 0.6, 0.1, 1)
+_DISABLED_BUTTON_COLOR: Final = (0.3, 0.3, 0.3, 1)  # Start button until it can be used
+_COPY_BUTTON_COLOR: Final = (0.3, 0.5, 0.3, 1)
+_LEAVE_BUTTON_COLOR: Final = (0.5, 0.3, 0.3, 1)
+_SECTION_FRAME_COLOR: Final = (0.15, 0.15, 0.15, 0.8)  # Host/join section backdrop
+_HOST_FRAME_SIZE: Final = (-0.75, 0.75, -0.25, 0.15)
+_JOIN_FRAME_SIZE: Final = (-0.75, 0.75, -0.35, 0.15)
+_SECTION_BUTTON_SIZE: Final = (-0.35, 0.35, -0.06, 0.08)  # Host/Join buttons
+_LOBBY_BUTTON_SIZE: Final = (-0.4, 0.4, -0.07, 0.09)  # Lobby ready/start buttons
+
+
+def _mk_label(
+    parent,
+    text: str,
+    scale: float,
+    pos: tuple[float, float, float],
+    text_fg: tuple,
+    font,
+    **overrides,
+) -> DirectLabel:
+    """Create a menu label from the shared defaults and place it."""
+    label = DirectLabel(
+        text=text,
+        scale=scale,
+        text_fg=text_fg,
+        text_font=font,
+        parent=parent,
+        **{**_LABEL_DEFAULTS, **overrides},
+    )
+    label.setPos(*pos)
+    return label
+
+
+# Persistent network workers, so blocking menu work doesn't spawn a fresh OS thread
+# each time. Host and join actions (spawning the server, tunnels, connecting) share a
+# single worker, which serializes them, e.g. a join can't race a host that is still
+# starting up. Speculative lookups (DNS prewarming, the local IP) get a worker of their
+# own, so a slow resolver can't hold up a click.
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="multiplayer-menu")
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="multiplayer-prefetch"
+)
+atexit.register(_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+atexit.register(_PREFETCH_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+
+def _run_logged(fn: Callable[[], None]) -> None:
+    try:
+        fn()
+    except Exception:
+        logger.exception("Multiplayer menu background task failed")
+
+
+def _submit(fn: Callable[[], None]) -> None:
+    """Run `fn` on the network worker thread, after any host or join before it."""
+    _EXECUTOR.submit(_run_logged, fn)
+
+
+def _prefetch(fn: Callable[[], None]) -> None:
+    """Run `fn` on the prefetch worker thread, alongside menu actions."""
+    _PREFETCH_EXECUTOR.submit(_run_logged, fn)
+
+
+# (ip, time.monotonic() of the lookup)
+_cached_local_ip: tuple[str, float] | None = None
+
+# Seconds a local IP lookup stays valid, so a network change is eventually noticed
+LOCAL_IP_TTL = 60.0
+
+
 def get_local_ip() -> str:
-    """Get the local IP address for sharing with friends."""
+    """Get the local IP address for sharing with friends.
+
+    The lookup costs a socket allocation and a kernel route lookup, so the result is
+    cached for `LOCAL_IP_TTL` seconds. Call `invalidate_local_ip_cache` to force a
+    fresh lookup sooner, e.g. if the network changes.
+    """
+    global _cached_local_ip
+
+    if _cached_local_ip is not None:
+        ip, ts = _cached_local_ip
+        if time.monotonic() - ts < LOCAL_IP_TTL:
+            return ip
+
+    # The hostname usually resolves locally (e.g. via /etc/hosts). Many systems map
+    # it to a loopback address though, in which case fall back to asking the kernel
+    # which interface routes outwards.
+    try:
+        ip = socket.gethostbyname(socket.gethostname())
+    except OSError:
+        ip = "127.0.0.1"
+
+    if ip.startswith("127."):
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                # Bound the lookup in case the host has no default route
+                s.settimeout(0.1)
+                s.connect(("8.8.8.8", 80))
+                ip = s.getsockname()[0]
+        except Exception:
+            return "127.0.0.1"
+
+    _cached_local_ip = (ip, time.monotonic())
+    return ip
+
+
+def invalidate_local_ip_cache() -> None:
+    """Forget the cached local IP so the next `get_local_ip` call looks it up again."""
+    global _cached_local_ip
+    _cached_local_ip = None
+
+
+_tunnel_url: str | None = None
+
+
+def start_tunnel(port: int) -> str | None:
+    """Open an ngrok TCP tunnel to a local port.
+
+    Returns:
+        The shareable "host:port" address, or None if pyngrok is unavailable or the
+        tunnel could not be created (e.g. no ngrok auth token is configured).
+    """
+    global _tunnel_url
+
+    prefetch_pyngrok()
+    if _ngrok is None:
+        return None
+
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
+        tunnel = _ngrok.connect(port, "tcp")
     except Exception:
-        return "127.0.0.1"
+        return None
+
+    _tunnel_url = tunnel.public_url
+    return _tunnel_url.removeprefix("tcp://")
+
+
+def stop_tunnel() -> None:
+    """Close the ngrok tunnel opened by `start_tunnel`, if any."""
+    global _tunnel_url
+
+    if _ngrok is None:
+        return
+
+    try:
+        if _tunnel_url is not None:
+            _ngrok.disconnect(_tunnel_url)
+        _ngrok.kill()
+    except Exception:
+        pass
+
+    _tunnel_url = None
+
+
+# Session-lifetime DNS cache, hostname -> IPv4 address. The port plays no part in
+# resolution, so it isn't part of the key. A host's entry is dropped when joining it
+# fails, in case the address has moved.
+_addr_cache: dict[str, str] = {}
+
+
+def _resolve(host: str) -> str:
+    """Resolve a hostname to an IPv4 address, caching the result for the session.
+
+    Returns the hostname unchanged if it can't be resolved, leaving the error to
+    surface when connecting.
+    """
+    if host in _addr_cache:
+        return _addr_cache[host]
+
+    try:
+        infos = socket.getaddrinfo(host, None, socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
+        return host
+
+    _addr_cache[host] = infos[0][4][0]
+    return _addr_cache[host]
+
+
+def _prewarm_resolve(*hosts: str) -> None:
+    """Resolve hosts into `_addr_cache` on a background thread."""
+    pending = [host for host in hosts if host and host not in _addr_cache]
+    if not pending:
+        return
+
+    def resolve_all():
+        for host in pending:
+            _resolve(host)
+
+    _prefetch(resolve_all)
+
+
+# Ingress hosts that ngrok hands out for TCP tunnels. Resolved while the user is still
+# reading the join form, so joining an internet game skips the DNS round trip.
+_COMMON_JOIN_HOSTS = ("0.tcp.ngrok.io",)
+
+
+# "host" or "host:port", optionally with the "tcp://" scheme ngrok prints
+_ADDR_RE = re.compile(r"^(?:tcp://)?(?P<host>[^:]+)(?::(?P<port>\d+))?$")
+
+
+def _parse_address(address: str) -> tuple[str, int]:
+    """Split an "ip" or "ip:port" address, defaulting to port 7777."""
+    m = _ADDR_RE.match(address.strip())
+    if m is None:
+        # Malformed port, keep the host part
+        return address.strip().removeprefix("tcp://").partition(":")[0], 7777
+
+    return m["host"], int(m["port"]) if m["port"] else 7777
+
+
+# Seconds between polls of the multiplayer client's message queue (~120 Hz)
+CLIENT_POLL_INTERVAL = 0.008
+
+# (socket option name, value) pairs applied to the client socket when available.
+# Idle 30 s before probing, then probe every 10 s and give up after 3 misses.
+_KEEPALIVE_OPTIONS: tuple[tuple[str, int], ...] = (
+    ("TCP_KEEPIDLE", 30),
+    ("TCP_KEEPINTVL", 10),
+    ("TCP_KEEPCNT", 3),
+)
+
+
+def _wait_for_port(
+    host: str, port: int, timeout: float = 3.0, interval: float = 0.02
+) -> bool:
+    """Block until a TCP server accepts connections on (host, port).
+
+    Returns False if nothing is listening after `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.1).close()
+            return True
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(interval)
+
+
+# Logged by the server once it's listening (see MultiplayerServer.start)
+_SERVER_READY_BANNER = b"Multiplayer server started"
+
+
+def _drain(pipe, prefix: str, ready: threading.Event | None = None) -> None:
+    """Forward a subprocess pipe to the log until EOF.
+
+    Keeps the pipe buffer from filling up (which would block the server on its next
+    write), and sets `ready` once the server reports that it's listening.
+    """
+    with pipe:
+        for line in iter(pipe.readline, b""):
+            if ready is not None and _SERVER_READY_BANNER in line:
+                ready.set()
+            logger.debug("%s%s", prefix, line.decode(errors="replace").rstrip())
 
 
 class MultiplayerMenu(BaseMenu):
@@ -73,19 +387,35 @@ class MultiplayerMenu(BaseMenu):
 
     def __init__(self) -> None:
         super().__init__()
-        self.client: MultiplayerClient | None = None
         self.server_process = None
         self.status_label: DirectLabel | None = None
         self.ip_label: DirectLabel | None = None
         self.public_url: str | None = None
 
+        # Host of the join in progress, if any, so a failed connect can forget its
+        # cached address
+        self._joining_host: str | None = None
+
+        # Address the lobby tells the host to share, settled once hosting is up
+        self.share_address: str = ""
+        self.share_is_public: bool = False
+
+        # Written by the background worker, read by the IP label's polling task
+        self._local_ip: str | None = None
+        _prefetch(self._lookup_local_ip)
+
+    @property
+    def client(self) -> MultiplayerClient | None:
+        """The multiplayer connection, shared with the lobby via `MenuRegistry`."""
+        return MenuRegistry.shared_client
+
+    @client.setter
+    def client(self, client: MultiplayerClient | None) -> None:
+        MenuRegistry.shared_client = client
+
     def populate(self) -> None:
-        # Clean up any stale client connection/task from previous session
-        Global.task_mgr.remove("multiplayer_client_update")
-        if self.client and self.client.is_connected and not self.server_process:
-            # Disconnect stale client (but keep if we're hosting)
-            self.client.disconnect()
-            self.client = None
+        # The connection and its update task are kept across visits, so that a
+        # later host/join can reuse the connection without missing messages.
 
         # Create title fresh each time to avoid stale node issues
         title = MenuTitle.create(text="Online Multiplayer")
@@ -95,48 +425,42 @@ class MultiplayerMenu(BaseMenu):
         title_font = load_font(TITLE_FONT)
 
         # Status label at top
-        self.status_label = DirectLabel(
-            text="Choose an option below",
-            scale=BUTTON_TEXT_SCALE * 0.7,
-            relief=None,
-            text_fg=(0.7, 0.7, 0.7, 1),
-            text_align=TextNode.ACenter,
-            text_font=title_font,
-            parent=self.area.getCanvas(),
+        self.status_label = _mk_label(
+            self.area.getCanvas(),
+            "Choose an option below",
+            BUTTON_TEXT_SCALE * 0.7,
+            (0, 0, 0.55),
+            _STATUS_IDLE,
+            title_font,
         )
-        self.status_label.setPos(0, 0, 0.55)
 
         # ==================== HOST GAME SECTION ====================
         host_frame = DirectFrame(
-            frameColor=(0.15, 0.15, 0.15, 0.8),
-            frameSize=(-0.75, 0.75, -0.25, 0.15),
+            frameColor=_SECTION_FRAME_COLOR,
+            frameSize=_HOST_FRAME_SIZE,
             pos=(0, 0, 0.25),
             parent=self.area.getCanvas(),
             state=DGG.NORMAL,
             suppressMouse=False,
         )
 
-        host_title = DirectLabel(
-            text="HOST A GAME",
-            scale=BUTTON_TEXT_SCALE * 0.9,
-            relief=None,
-            text_fg=(0.3, 0.8, 0.3, 1),
-            text_align=TextNode.ACenter,
-            text_font=title_font,
-            parent=host_frame,
+        _mk_label(
+            host_frame,
+            "HOST A GAME",
+            BUTTON_TEXT_SCALE * 0.9,
+            (0, 0, 0.08),
+            _STATUS_OK,
+            title_font,
         )
-        host_title.setPos(0, 0, 0.08)
 
-        host_desc = DirectLabel(
-            text="Start a server and invite friends",
-            scale=BUTTON_TEXT_SCALE * 0.5,
-            relief=None,
-            text_fg=(0.6, 0.6, 0.6, 1),
-            text_align=TextNode.ACenter,
-            text_font=font,
-            parent=host_frame,
+        _mk_label(
+            host_frame,
+            "Start a server and invite friends",
+            BUTTON_TEXT_SCALE * 0.5,
+            (0, 0, 0.0),
+            _MUTED_TEXT_COLOR,
+            font,
         )
-        host_desc.setPos(0, 0, 0.0)
 
         self.host_button = DirectButton(
             text="Host Game",
@@ -144,8 +468,8 @@ class MultiplayerMenu(BaseMenu):
             text_font=font,
             scale=BUTTON_TEXT_SCALE * 1.2,
             relief=DGG.RIDGE,
-            frameColor=(0.2, 0.6, 0.2, 1),
-            frameSize=(-0.35, 0.35, -0.06, 0.08),
+            frameColor=_HOST_BUTTON_COLOR,
+            frameSize=_SECTION_BUTTON_SIZE,
             command=self._host_game,
             parent=host_frame,
         )
@@ -153,62 +477,59 @@ class MultiplayerMenu(BaseMenu):
 
         # ==================== JOIN GAME SECTION ====================
         join_frame = DirectFrame(
-            frameColor=(0.15, 0.15, 0.15, 0.8),
-            frameSize=(-0.75, 0.75, -0.35, 0.15),
+            frameColor=_SECTION_FRAME_COLOR,
+            frameSize=_JOIN_FRAME_SIZE,
             pos=(0, 0, -0.25),
             parent=self.area.getCanvas(),
             state=DGG.NORMAL,
             suppressMouse=False,
         )
 
-        join_title = DirectLabel(
-            text="JOIN A GAME",
-            scale=BUTTON_TEXT_SCALE * 0.9,
-            relief=None,
-            text_fg=(0.3, 0.6, 0.9, 1),
-            text_align=TextNode.ACenter,
-            text_font=title_font,
-            parent=join_frame,
+        _mk_label(
+            join_frame,
+            "JOIN A GAME",
+            BUTTON_TEXT_SCALE * 0.9,
+            (0, 0, 0.08),
+            _JOIN_ACCENT_COLOR,
+            title_font,
         )
-        join_title.setPos(0, 0, 0.08)
 
-        join_desc = DirectLabel(
-            text="Enter the host's IP address",
-            scale=BUTTON_TEXT_SCALE * 0.5,
-            relief=None,
-            text_fg=(0.6, 0.6, 0.6, 1),
-            text_align=TextNode.ACenter,
-            text_font=font,
-            parent=join_frame,
+        _mk_label(
+            join_frame,
+            "Enter the host's IP address",
+            BUTTON_TEXT_SCALE * 0.5,
+            (0, 0, 0.0),
+            _MUTED_TEXT_COLOR,
+            font,
         )
-        join_desc.setPos(0, 0, 0.0)
 
         # IP input
-        ip_label = DirectLabel(
-            text="IP:",
-            scale=BUTTON_TEXT_SCALE * 0.6,
-            relief=None,
-            text_fg=TEXT_COLOR,
+        _mk_label(
+            join_frame,
+            "IP:",
+            BUTTON_TEXT_SCALE * 0.6,
+            (-0.35, 0, -0.12),
+            TEXT_COLOR,
+            font,
             text_align=TextNode.ARight,
-            text_font=font,
-            parent=join_frame,
         )
-        ip_label.setPos(-0.35, 0, -0.12)
 
         self.ip_entry = DirectEntry(
             text="",
             scale=BUTTON_TEXT_SCALE * 0.6,
             width=15,
             relief=DGG.SUNKEN,
-            frameColor=(1, 1, 1, 0.9),
-            text_fg=(0, 0, 0, 1),
+            frameColor=_ENTRY_FRAME_COLOR,
+            text_fg=_ENTRY_TEXT_COLOR,
             text_font=font,
             initialText="host-ip:7777",
             numLines=1,
+            focusOutCommand=self._prewarm_join_address,
             parent=join_frame,
         )
         self.ip_entry.setPos(-0.25, 0, -0.12)
         self.register_input_field(self.ip_entry)
+        _prewarm_resolve(*_COMMON_JOIN_HOSTS)
 
         self.join_button = DirectButton(
             text="Join Game",
@@ -216,25 +537,27 @@ class MultiplayerMenu(BaseMenu):
             text_font=font,
             scale=BUTTON_TEXT_SCALE * 1.2,
             relief=DGG.RIDGE,
-            frameColor=(0.2, 0.4, 0.7, 1),
-            frameSize=(-0.35, 0.35, -0.06, 0.08),
+            frameColor=_JOIN_BUTTON_COLOR,
+            frameSize=_SECTION_BUTTON_SIZE,
             command=self._join_game,
             parent=join_frame,
         )
         self.join_button.setPos(0, 0, -0.25)
 
-        # Your IP display (for sharing)
-        local_ip = get_local_ip()
-        self.ip_label = DirectLabel(
-            text=f"Your IP: {local_ip}",
-            scale=BUTTON_TEXT_SCALE * 0.5,
-            relief=None,
-            text_fg=(0.5, 0.5, 0.5, 1),
-            text_align=TextNode.ACenter,
-            text_font=font,
-            parent=self.area.getCanvas(),
+        # Your IP display (for sharing). The lookup is a blocking socket call, so it
+        # runs on the prefetch worker and the label fills itself in once it's known.
+        self.ip_label = _mk_label(
+            self.area.getCanvas(),
+            f"Your IP: {self._local_ip or '...'}",
+            BUTTON_TEXT_SCALE * 0.5,
+            (0, 0, -0.7),
+            _DIM_TEXT_COLOR,
+            font,
         )
-        self.ip_label.setPos(0, 0, -0.7)
+        self._local_ip = None
+        _prefetch(self._lookup_local_ip)
+        Global.task_mgr.remove("multiplayer_ip_label")
+        Global.task_mgr.doMethodLater(0.05, self._poll_local_ip, "multiplayer_ip_label")
 
         # Back button - create fresh each time
         back_button = MenuButton.create(
@@ -244,7 +567,21 @@ class MultiplayerMenu(BaseMenu):
         )
         self.add_button(back_button)
 
-    def _update_status(self, text: str, color: tuple = (0.7, 0.7, 0.7, 1)) -> None:
+    def _lookup_local_ip(self) -> None:
+        """Worker job: look up the local IP for the IP label."""
+        self._local_ip = get_local_ip()
+
+    def _poll_local_ip(self, task):
+        """Fill in the IP label once the worker has looked up the local IP."""
+        if self._local_ip is None:
+            return task.again
+
+        # Hosting may already have replaced the label with the address to share
+        if self.ip_label and self.ip_label["text"].startswith("Your IP:"):
+            self.ip_label["text"] = f"Your IP: {self._local_ip}"
+        return task.done
+
+    def _update_status(self, text: str, color: tuple = _STATUS_IDLE) -> None:
         """Update status message."""
         if self.status_label:
             self.status_label["text"] = text
@@ -252,109 +589,285 @@ class MultiplayerMenu(BaseMenu):
 
     def _host_game(self) -> None:
         """Start server for LAN/VPN play and create a game room."""
-        self._update_status("Starting server...", (0.8, 0.8, 0.3, 1))
-
-        # Start the server in a subprocess
-        try:
-            self.server_process = subprocess.Popen(
-                [sys.executable, "-m", "pooltool.multiplayer.server"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-
-            # Give server time to start, then connect locally
-            def setup_and_connect():
-                import time
-                time.sleep(1.0)
+        self._update_status("Starting server...", _STATUS_PENDING)
+
+        # Spawning the interpreter and waiting for it to come up both happen on a
+        # background thread so the UI keeps rendering in the meantime
+        def spawn_and_connect():
+            # ngrok forwards connections lazily, so the tunnel can be opened while
+            # the server is still starting up rather than after it
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                tunnel = pool.submit(start_tunnel, 7777)
+                try:
+                    # The server only logs, and logging goes to stderr. stdout is
+                    # discarded so it needs no pipe or drain thread.
+                    self.server_process = subprocess.Popen(
+                        [sys.executable, "-m", "pooltool.multiplayer.server"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                    )
+                except Exception as e:
+                    Global.task_mgr.add(
+                        partial(
+                            self._status_task,
+                            f"Failed to start server: {e}",
+                            _STATUS_ERROR,
+                        ),
+                        "server_failed_task",
+                    )
+                    tunnel.add_done_callback(lambda _: stop_tunnel())
+                    return
+
+                if not self._wait_for_server():
+                    self.server_process.terminate()
+                    self.server_process = None
+                    Global.task_mgr.add(
+                        partial(
+                            self._status_task,
+                            "Failed to start server",
+                            _STATUS_ERROR,
+                        ),
+                        "server_failed_task",
+                    )
+                    tunnel.add_done_callback(lambda _: stop_tunnel())
+                    return
+
+                # Tell the user the server is up if the tunnel is still pending
+                if not tunnel.done():
+                    Global.task_mgr.add(
+                        partial(
+                            self._status_task,
+                            "Server running, opening tunnel...",
+                            _STATUS_PENDING,
+                        ),
+                        "server_up_task",
+                    )
+
+                # Expose the server over the internet if ngrok is available,
+                # otherwise fall back to LAN/VPN play
+                public_url = self.public_url = tunnel.result()
+
+            if public_url:
                 Global.task_mgr.add(
-                    lambda task: self._connect_as_host_lan(),
-                    "connect_as_host_task"
+                    partial(self._tunnel_ready_task, public_url), "tunnel_ready_task"
+                )
+            else:
+                Global.task_mgr.add(self._connect_host_lan_cb, "connect_as_host_task")
+
+        _submit(spawn_and_connect)
+
+    def _wait_for_server(self) -> bool:
+        """Block until the spawned server is accepting connections.
+
+        Also starts draining the server's stderr pipe.
+
+        Returns:
+            False if the server exited, or still isn't accepting connections after
+            a few seconds.
+        """
+        process = self.server_process
+        assert process is not None
+
+        ready = threading.Event()
+        threading.Thread(
+            target=_drain,
+            args=(process.stderr, "[srv] ", ready),
+            daemon=True,
+        ).start()
+
+        # The server logs its startup banner to stderr. Fall back to probing the
+        # port in case the banner never shows up.
+        deadline = time.monotonic() + 3.0
+        while not ready.wait(timeout=0.05):
+            if process.poll() is not None:
+                return False
+            if time.monotonic() >= deadline:
+                return _wait_for_port("127.0.0.1", 7777, timeout=0.5) and (
+                    process.poll() is None
                 )
+        return True
+
+    def _status_task(self, text: str, color: tuple, task):
+        """One-shot task: update the status message from the main thread."""
+        self._update_status(text, color)
+        return task.done
 
-            threading.Thread(target=setup_and_connect, daemon=True).start()
+    def _tunnel_ready_task(self, public_url: str, task):
+        """One-shot task: continue hosting on the main thread once tunneled."""
+        self._on_tunnel_ready(public_url)
+        return task.done
+
+    def _connect_host_lan_cb(self, task):
+        """One-shot task: continue hosting on the main thread for LAN/VPN play."""
+        self._connect_as_host_lan()
+        return task.done
+
+    def _on_tunnel_ready(self, public_url: str) -> None:
+        """Connect as host once the internet tunnel is up."""
+        self.share_address = public_url
+        self.share_is_public = True
+
+        if self.ip_label:
+            self.ip_label["text"] = f"Share this address with friends: {public_url}"
+            self.ip_label["text_fg"] = _SHARE_TEXT_COLOR
 
-        except Exception as e:
-            self._update_status(f"Failed to start server: {e}", (0.8, 0.3, 0.3, 1))
+        self._update_status("Server ready for internet play", _STATUS_OK)
+        self._connect_as_host()
 
     def _connect_as_host_lan(self) -> None:
         """Connect as host (LAN or VPN like Hamachi)."""
+        local_ip = get_local_ip()
+        self.share_address = f"{local_ip}:7777"
+        self.share_is_public = False
+
         if self.ip_label:
-            local_ip = get_local_ip()
             self.ip_label["text"] = (
                 f"Share your LAN/VPN IP + port 7777 (e.g., {local_ip}:7777).\n"
                 "If using Hamachi, share your Hamachi IPv4."
             )
-            self.ip_label["text_fg"] = (0.3, 0.9, 0.3, 1)
+            self.ip_label["text_fg"] = _SHARE_TEXT_COLOR
         
-        self._update_status("Server ready for LAN/VPN play", (0.3, 0.8, 0.3, 1))
+        self._update_status("Server ready for LAN/VPN play", _STATUS_OK)
         self._connect_as_host()
 
     def _connect_as_host(self) -> None:
         """Connect to the local server as host."""
-        self._setup_client()
+        self._start_client_updates()
+        if self._setup_client("localhost", 7777):
+            self._on_connected(self.client.player_id)
+            return
+
         self.client.connect("localhost", 7777, "Host")
-        self._update_status("Connecting to local server...", (0.8, 0.8, 0.3, 1))
-        Global.task_mgr.add(self._update_client, "multiplayer_client_update")
+        self._update_status("Connecting to local server...", _STATUS_PENDING)
+
+    def _prewarm_join_address(self) -> None:
+        """Start resolving the typed host as soon as the address field loses focus."""
+        address = self.ip_entry.get().strip()
+        if address:
+            _prewarm_resolve(_parse_address(address)[0])
 
     def _join_game(self) -> None:
         """Join a remote game (LAN or VPN IP:port)."""
         address = self.ip_entry.get().strip()
         if not address:
-            self._update_status("Please enter the host's IP (LAN/Hamachi)", (0.8, 0.3, 0.3, 1))
+            self._update_status(
+                "Please enter the host's IP (LAN/Hamachi)", _STATUS_ERROR
+            )
             return
 
-        # Parse address - expected "ip" or "ip:port"
-        if ":" in address:
-            parts = address.rsplit(":", 1)
-            host = parts[0]
-            try:
-                port = int(parts[1])
-            except ValueError:
-                port = 7777
-        else:
-            host = address
-            port = 7777
+        host, port = _parse_address(address)
 
-        self._update_status(f"Connecting to {host}:{port}...", (0.8, 0.8, 0.3, 1))
-        self._setup_client()
-        self.client.connect(host, port, "Player")
-        Global.task_mgr.add(self._update_client, "multiplayer_client_update")
+        self._start_client_updates()
+        self._joining_host = host
+        if self._setup_client(host, port):
+            self._on_connected(self.client.player_id)
+            return
 
-    def _setup_client(self) -> None:
-        """Initialize the multiplayer client."""
-        # Always create a fresh client to avoid stale connection issues
-        if self.client and self.client.is_connected:
-            self.client.disconnect()
-        self.client = MultiplayerClient()
+        self._update_status(f"Connecting to {host}:{port}...", _STATUS_PENDING)
 
-        self.client.on_connected = self._on_connected
+        # Resolve off the UI thread, then connect straight to the cached address so
+        # the client doesn't pay for another DNS lookup
+        client = self.client
+        _submit(lambda: client.connect(_resolve(host), port, "Player"))
+
+    def _setup_client(self, host: str, port: int) -> bool:
+        """Initialize the multiplayer client for a server.
+
+        A live connection to the same server is reused, saving the TCP and protocol
+        handshake. Any other existing connection is closed.
+
+        Returns:
+            True if an already-connected client was reused, in which case there is
+            no need to call `connect`.
+        """
+        client = self.client
+        reused = (
+            client is not None
+            and client.is_connected
+            and client.endpoint == (_addr_cache.get(host, host), port)
+        )
+
+        if not reused:
+            if client and client.is_connected:
+                client.disconnect()
+            self.client = MultiplayerClient()
+
+        assert self.client is not None
+
+        self.client.on_connected = self._wrap_on_connected(self._on_connected)
         self.client.on_disconnected = self._on_disconnected
         self.client.on_room_list = self._on_room_list
         self.client.on_room_update = self._on_room_update
         self.client.on_game_start = self._on_game_start
         self.client.on_error = self._on_error
 
+        return reused
+
+    def _wrap_on_connected(
+        self, callback: Callable[[str], None]
+    ) -> Callable[[str], None]:
+        """Tune the client socket for small, latency-sensitive messages on connect."""
+
+        def on_connected(player_id: str) -> None:
+            self._tune_client_socket()
+            callback(player_id)
+
+        return on_connected
+
+    def _tune_client_socket(self) -> None:
+        """Enable keepalive probes on the client socket.
+
+        Keepalive makes a dropped NAT mapping or half-closed peer surface as a
+        disconnect within about a minute, rather than the OS default of hours.
+        """
+        if not self.client:
+            return
+
+        client = self.client
+        client.set_socket_option(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        # Not every platform exposes the keepalive timing knobs
+        for name, value in _KEEPALIVE_OPTIONS:
+            if hasattr(socket, name):
+                client.set_socket_option(
+                    socket.IPPROTO_TCP, getattr(socket, name), value
+                )
+
+    def _start_client_updates(self) -> None:
+        """Start the task that pumps client messages, unless it's already running.
+
+        Messages are polled at a fixed rate rather than every rendered frame, since
+        the network doesn't need 60-144 Hz polling.
+        """
+        if Global.task_mgr.hasTaskNamed("multiplayer_client_update"):
+            return
+
+        Global.task_mgr.doMethodLater(
+            CLIENT_POLL_INTERVAL, self._update_client, "multiplayer_client_update"
+        )
+
     def _update_client(self, task):
         """Update client to process messages."""
         if self.client:
             self.client.update()
-        return task.cont
+        return task.again
 
     def _on_connected(self, player_id: str) -> None:
         """Handle successful connection."""
+        self._joining_host = None
         # Automatically create/join a room
         if self.server_process:
             # We're the host - create a room and go to lobby
-            self._update_status("Creating room...", (0.3, 0.8, 0.3, 1))
+            self._update_status("Creating room...", _STATUS_OK)
             self.client.create_room("Game Room", "8ball")
         else:
             # We're joining - request room list and auto-join first available
-            self._update_status("Finding room...", (0.8, 0.8, 0.3, 1))
+            self._update_status("Finding room...", _STATUS_PENDING)
             self.client.request_room_list()
 
     def _on_disconnected(self) -> None:
         """Handle disconnection."""
-        self._update_status("Disconnected", (0.8, 0.3, 0.3, 1))
+        self._update_status("Disconnected", _STATUS_ERROR)
         Global.task_mgr.remove("multiplayer_client_update")
 
     def _on_room_list(self, rooms: list[dict]) -> None:
@@ -363,13 +876,20 @@ class MultiplayerMenu(BaseMenu):
             room_id = rooms[0].get("room_id", "")
             if room_id:
                 self.client.join_room(room_id)
-                self._update_status("Joining room...", (0.8, 0.8, 0.3, 1))
+                self._update_status("Joining room...", _STATUS_PENDING)
         else:
-            self._update_status("No rooms available. Try hosting instead.", (0.8, 0.5, 0.3, 1))
+            self._update_status(
+                "No rooms available. Try hosting instead.", _WARNING_COLOR
+            )
 
     def _on_room_update(self, room: RoomInfo) -> None:
-        """Handle room update - go to lobby."""
-        self._update_status("In lobby!", (0.3, 0.8, 0.3, 1))
+        """Handle room update - go to lobby, or let it refresh if already there."""
+        current = MenuRegistry.get_current_menu()
+        if current is not None and current.name == "multiplayer_lobby":
+            Global.base.messenger.send(LOBBY_STATE_CHANGED, [room])
+            return
+
+        self._update_status("In lobby!", _STATUS_OK)
         MenuNavigator.go_to_menu("multiplayer_lobby")()
 
     def _on_game_start(self, game_state) -> None:
@@ -381,13 +901,21 @@ class MultiplayerMenu(BaseMenu):
         # Map technical errors to user-friendly messages
         error_messages = {
             "Connection refused": "Could not connect to server. Is it running?",
+            "Connection failed": "Could not reach the server",
             "Connection timeout": "Lost connection to server",
             "Room not found": "The game room no longer exists",
             "Room is full": "This room is already full",
             "Game already in progress": "Cannot join - game already started",
         }
         display_error = error_messages.get(error, error)
-        self._update_status(f"Error: {display_error}", (0.8, 0.3, 0.3, 1))
+
+        # The cached address may be stale (ngrok endpoints move), so the next
+        # attempt resolves again
+        if error in ("Connection refused", "Connection failed") and self._joining_host:
+            _addr_cache.pop(self._joining_host, None)
+            self._joining_host = None
+
+        self._update_status(f"Error: {display_error}", _STATUS_ERROR)
 
     def _go_back(self) -> None:
         """Return to main menu."""
@@ -396,9 +924,13 @@ class MultiplayerMenu(BaseMenu):
             self.client.disconnect()
         Global.task_mgr.remove("multiplayer_client_update")
 
-        # Stop tunnel if running
-        stop_tunnel()
+        # Stop tunnel if running. ngrok.kill() blocks on the ngrok process, so skip it
+        # when this session never hosted.
+        if self.server_process is not None or _tunnel_url is not None:
+            stop_tunnel()
         self.public_url = None
+        self.share_address = ""
+        self.share_is_public = False
 
         # Kill server if we started one
         if self.server_process:
@@ -409,13 +941,17 @@ class MultiplayerMenu(BaseMenu):
 
     def hide(self) -> None:
         """Clean up when hiding menu."""
+        Global.task_mgr.remove("multiplayer_ip_label")
         super().hide()
 
     def cleanup(self) -> None:
         """Full cleanup of multiplayer resources."""
         Global.task_mgr.remove("multiplayer_client_update")
-        stop_tunnel()
+        if self.server_process is not None or _tunnel_url is not None:
+            stop_tunnel()
         self.public_url = None
+        self.share_address = ""
+        self.share_is_public = False
 
         if self.client and self.client.is_connected:
             self.client.disconnect()
@@ -426,6 +962,66 @@ class MultiplayerMenu(BaseMenu):
             self.server_process = None
 
 
+def _player_name_style(player: PlayerInfo, is_you: bool) -> tuple[str, tuple]:
+    """Text and color of a player's name in the lobby list."""
+    name_text = player.name
+    if is_you:
+        name_text += " (You)"
+    if player.is_host:
+        name_text += " [HOST]"
+
+    name_color = _OWN_NAME_COLOR if is_you else _STATUS_IDLE
+    return name_text, name_color
+
+
+def _player_status_style(player: PlayerInfo) -> tuple[str, tuple]:
+    """Text and color of a player's ready status in the lobby list."""
+    if player.is_ready:
+        return "READY", _SHARE_TEXT_COLOR
+    return "Not Ready", _DIM_TEXT_COLOR
+
+
+def _start_button_state(room: RoomInfo | None, client) -> tuple[str, bool]:
+    """Label of the host's start button, and whether the game can be started."""
+    # Check if we need more players
+    need_players = not room or len(room.players) < 2
+
+    if need_players:
+        return "Waiting for player...", False
+    # The host is automatically ready, so this is whether everyone else is
+    if not (client and client.all_ready):
+        return "Waiting for ready...", False
+    return "START GAME", True
+
+
+def _set_label(label: DirectLabel, text: str, color: tuple) -> None:
+    """Set a label's text and color, skipping the text regeneration if unchanged.
+
+    The player list styles derive the color from the same state as the text, so an
+    unchanged text means an unchanged color.
+    """
+    if label["text"] != text:
+        label["text"] = text
+        label["text_fg"] = color
+
+
+def _room_state(room: RoomInfo | None, client) -> tuple:
+    """Everything about a room that the lobby displays, for change detection."""
+    players = (
+        tuple((p.player_id, p.name, p.is_ready, p.is_host) for p in room.players)
+        if room
+        else ()
+    )
+    return players, client.player_id if client else None
+
+
+# Messenger event sent with the new RoomInfo whenever the lobby's room state changes
+LOBBY_STATE_CHANGED = "lobby-state-changed"
+
+# Upper bound on players in a room, used to size the lobby's player list pool
+MAX_PLAYERS = 8
+
+
 class MultiplayerLobbyMenu(BaseMenu):
     """ Lobby - shows players, ready button, and start game for host."""
 
@@ -434,37 +1030,77 @@ class MultiplayerLobbyMenu(BaseMenu):
     def __init__(self) -> None:
         super().__init__()
         self._dynamic_elements = []
+        self._dynamic_parent: NodePath | None = None
         self._callbacks_registered = False
         self._last_error: str | None = None
 
+        # Widgets that are patched in place when only room state changes
+        self.share_label: DirectLabel | None = None
+        self._share_address = ""
+        self._copy_btn: DirectButton | None = None
+        self.mode_label: DirectLabel | None = None
+        self.waiting_label: DirectLabel | None = None
+        self.error_label: DirectLabel | None = None
+        self.ready_btn: DirectButton | None = None
+        self.start_btn: DirectButton | None = None
+
+        # The widget tree is built once and reused across shows. It's only rebuilt
+        # when the (is_hosting, is_host) pair it was laid out for changes.
+        self._built = False
+        self._built_layout: tuple[bool, bool] | None = None
+
+        # What the lobby last displayed, see `_room_state`
+        self._last_room_state: tuple | None = None
+
+        # Room state changes are broadcast as an event and applied incrementally
+        Global.base.accept(LOBBY_STATE_CHANGED, self._on_lobby_state_changed)
+
+        # Pooled (name, status) label pairs for the player list. Created once and
+        # reused across refreshes, since a room never holds more than MAX_PLAYERS.
+        self._player_slots: list[tuple[DirectLabel, DirectLabel]] = []
+        self._players_top = 0.0
+
+        # Slots currently showing a player, keyed by player_id, so a refresh only
+        # touches the labels of players whose state changed
+        self._player_widgets: dict[str, tuple[DirectLabel, DirectLabel]] = {}
+        self._showing_players = False
+
     def _clear_dynamic_elements(self) -> None:
         """Clear all dynamically created elements to prevent overlap on refresh."""
+        # Detach the whole tree first so the canvas is invalidated once, rather than
+        # once per widget. The widgets still need destroying to release their
+        # DirectGui bindings.
+        if self._dynamic_parent is not None:
+            self._dynamic_parent.detachNode()
         for elem in self._dynamic_elements:
             try:
                 elem.destroy()
             except Exception:
-                try:
-                    elem.removeNode()
-                except Exception:
-                    pass
+                pass
+        if self._dynamic_parent is not None:
+            self._dynamic_parent.removeNode()
+            self._dynamic_parent = None
         self._dynamic_elements = []
+        self.share_label = None
+        self._copy_btn = None
+        self.mode_label = None
+        self.waiting_label = None
+        self.error_label = None
+        self.ready_btn = None
+        self.start_btn = None
+        self._built = False
+        self._built_layout = None
+        self._last_room_state = None
+        self._hide_player_slots()
 
     def populate(self) -> None:
-        from pooltool.ani.menu._registry import MenuRegistry
-
-        # Clear any existing dynamic elements first
-        self._clear_dynamic_elements()
-
         # Create title fresh each time to avoid stale node issues
         title = MenuTitle.create(text="Game Lobby")
         self.add_title(title)
 
-        font = load_font(BUTTON_FONT)
-        title_font = load_font(TITLE_FONT)
-
         # Get client
         mp_menu = MenuRegistry.get_menu("multiplayer")
-        client = mp_menu.client if mp_menu and hasattr(mp_menu, "client") else None
+        client = mp_menu.client if mp_menu is not None else None
         room = client.current_room if client else None
 
         # Register callbacks for auto-refresh (only once)
@@ -473,35 +1109,45 @@ class MultiplayerLobbyMenu(BaseMenu):
             self._callbacks_registered = True
 
         # Determine if current player is host
-        is_host = False
-        is_ready = False
-        all_ready = False
-        if client and room and room.players:
-            for p in room.players:
-                if p.player_id == client.player_id:
-                    is_host = p.is_host
-                    is_ready = p.is_ready
-            all_ready = all(p.is_ready for p in room.players) and len(room.players) >= 2
+        me = client.my_player if client else None
+        is_host = me is not None and me.is_host
+
+        is_hosting = mp_menu is not None and mp_menu.server_process is not None
+
+        # The widget tree only depends on the hosting/host roles. As long as those
+        # are unchanged, the existing tree is reused and just refreshed from the room.
+        layout = (is_hosting, is_host)
+        if not self._built or self._built_layout != layout:
+            self._clear_dynamic_elements()
+            self._build(is_hosting, is_host)
+            self._built = True
+            self._built_layout = layout
+
+        self._refresh_from_room(room, client)
+
+    def _build(self, is_hosting: bool, is_host: bool) -> None:
+        """Create the lobby widgets for the given hosting/host roles."""
+        font = load_font(BUTTON_FONT)
+        title_font = load_font(TITLE_FONT)
+
+        # Everything built here hangs off one node, so tearing the tree down again
+        # is a single scene graph change
+        parent = self._dynamic_parent = self.area.getCanvas().attachNewNode(
+            "lobby_dynamic"
+        )
 
         # Share address section - only show for host
-        is_hosting = mp_menu and hasattr(mp_menu, "server_process") and mp_menu.server_process is not None
-        
         if is_hosting:
-            share_address = mp_menu.public_url if (mp_menu and hasattr(mp_menu, "public_url") and mp_menu.public_url) else f"{get_local_ip()}:7777"
-            is_public = mp_menu and hasattr(mp_menu, "public_url") and mp_menu.public_url
-            self._share_address = share_address  # Store for copy button
-
-            share_label = DirectLabel(
-                text=f"Share: {share_address}",
-                scale=BUTTON_TEXT_SCALE * 0.6,
-                relief=None,
-                text_fg=(0.3, 0.9, 0.3, 1) if is_public else (0.9, 0.7, 0.3, 1),
-                text_align=TextNode.ACenter,
-                text_font=font,
-                parent=self.area.getCanvas(),
+            share_label = _mk_label(
+                parent,
+                "",
+                BUTTON_TEXT_SCALE * 0.6,
+                (0, 0, 0.52),
+                TEXT_COLOR,
+                font,
             )
-            share_label.setPos(0, 0, 0.52)
             self._dynamic_elements.append(share_label)
+            self.share_label = share_label
 
             # Copy button for share address
             self._copy_btn_text = "Copy Link"
@@ -511,109 +1157,63 @@ class MultiplayerLobbyMenu(BaseMenu):
                 text_font=font,
                 scale=BUTTON_TEXT_SCALE * 0.7,
                 relief=DGG.RIDGE,
-                frameColor=(0.3, 0.5, 0.3, 1),
+                frameColor=_COPY_BUTTON_COLOR,
                 frameSize=(-0.25, 0.25, -0.05, 0.07),
                 command=self._copy_share_link,
-                parent=self.area.getCanvas(),
+                parent=parent,
             )
             copy_btn.setPos(0, 0, 0.42)
             self._dynamic_elements.append(copy_btn)
             self._copy_btn = copy_btn
 
-            mode_text = "(Internet)" if is_public else "(LAN only)"
-            mode_label = DirectLabel(
-                text=mode_text,
-                scale=BUTTON_TEXT_SCALE * 0.4,
-                relief=None,
-                text_fg=(0.5, 0.8, 0.5, 1) if is_public else (0.6, 0.5, 0.3, 1),
-                text_align=TextNode.ACenter,
-                text_font=font,
-                parent=self.area.getCanvas(),
+            mode_label = _mk_label(
+                parent,
+                "",
+                BUTTON_TEXT_SCALE * 0.4,
+                (0, 0, 0.33),
+                TEXT_COLOR,
+                font,
             )
-            mode_label.setPos(0, 0, 0.33)
             self._dynamic_elements.append(mode_label)
+            self.mode_label = mode_label
         else:
             # Non-host sees a waiting message instead
-            waiting_host_label = DirectLabel(
-                text="Connected to host's game",
-                scale=BUTTON_TEXT_SCALE * 0.6,
-                relief=None,
-                text_fg=(0.3, 0.8, 0.9, 1),
-                text_align=TextNode.ACenter,
-                text_font=font,
-                parent=self.area.getCanvas(),
+            waiting_host_label = _mk_label(
+                parent,
+                "Connected to host's game",
+                BUTTON_TEXT_SCALE * 0.6,
+                (0, 0, 0.45),
+                _GUEST_BANNER_COLOR,
+                font,
             )
-            waiting_host_label.setPos(0, 0, 0.45)
             self._dynamic_elements.append(waiting_host_label)
 
         # Players section header - adjust position based on whether share section is shown
         players_header_y = 0.20 if is_hosting else 0.30
-        players_header = DirectLabel(
-            text="--- Players ---",
-            scale=BUTTON_TEXT_SCALE * 0.7,
-            relief=None,
-            text_fg=(0.7, 0.7, 0.7, 1),
-            text_align=TextNode.ACenter,
-            text_font=title_font,
-            parent=self.area.getCanvas(),
+        players_header = _mk_label(
+            parent,
+            "--- Players ---",
+            BUTTON_TEXT_SCALE * 0.7,
+            (0, 0, players_header_y),
+            _STATUS_IDLE,
+            title_font,
         )
-        players_header.setPos(0, 0, players_header_y)
         self._dynamic_elements.append(players_header)
 
         # Player list - cleaner layout, adjust based on share section
-        y_pos = 0.05 if is_hosting else 0.15
-        if room and room.players:
-            for player in room.players:
-                is_you = client and player.player_id == client.player_id
-
-                # Player name
-                name_text = player.name
-                if is_you:
-                    name_text += " (You)"
-                if player.is_host:
-                    name_text += " [HOST]"
-
-                name_color = (0.9, 0.9, 0.9, 1) if is_you else (0.7, 0.7, 0.7, 1)
-                name_label = DirectLabel(
-                    text=name_text,
-                    scale=BUTTON_TEXT_SCALE * 0.65,
-                    relief=None,
-                    text_fg=name_color,
-                    text_align=TextNode.ACenter,
-                    text_font=font,
-                    parent=self.area.getCanvas(),
-                )
-                name_label.setPos(0, 0, y_pos)
-                self._dynamic_elements.append(name_label)
-
-                # Ready status on separate line
-                status_text = "READY" if player.is_ready else "Not Ready"
-                status_color = (0.3, 0.9, 0.3, 1) if player.is_ready else (0.5, 0.5, 0.5, 1)
-                status_label = DirectLabel(
-                    text=status_text,
-                    scale=BUTTON_TEXT_SCALE * 0.45,
-                    relief=None,
-                    text_fg=status_color,
-                    text_align=TextNode.ACenter,
-                    text_font=font,
-                    parent=self.area.getCanvas(),
-                )
-                status_label.setPos(0, 0, y_pos - 0.07)
-                self._dynamic_elements.append(status_label)
-
-                y_pos -= 0.18
-        else:
-            waiting_label = DirectLabel(
-                text="Waiting for players...",
-                scale=BUTTON_TEXT_SCALE * 0.6,
-                relief=None,
-                text_fg=(0.5, 0.5, 0.5, 1),
-                text_align=TextNode.ACenter,
-                text_font=font,
-                parent=self.area.getCanvas(),
-            )
-            waiting_label.setPos(0, 0, 0.0)
-            self._dynamic_elements.append(waiting_label)
+        self._players_top = 0.05 if is_hosting else 0.15
+        self._ensure_player_slots(font)
+        waiting_label = _mk_label(
+            parent,
+            "Waiting for players...",
+            BUTTON_TEXT_SCALE * 0.6,
+            (0, 0, 0.0),
+            _DIM_TEXT_COLOR,
+            font,
+        )
+        waiting_label.hide()
+        self._dynamic_elements.append(waiting_label)
+        self.waiting_label = waiting_label
 
         # Buttons section
         btn_y = -0.35
@@ -621,50 +1221,37 @@ class MultiplayerLobbyMenu(BaseMenu):
         # Ready button - only for non-host players (host is auto-ready)
         if not is_host:
             ready_btn = DirectButton(
-                text="READY!" if not is_ready else "NOT READY",
+                text="READY!",
                 text_align=TextNode.ACenter,
                 text_font=font,
                 scale=BUTTON_TEXT_SCALE * 1.3,
                 relief=DGG.RIDGE,
-                frameColor=(0.2, 0.7, 0.2, 1) if not is_ready else (0.7, 0.3, 0.3, 1),
-                frameSize=(-0.4, 0.4, -0.07, 0.09),
+                frameColor=_READY_BUTTON_COLOR,
+                frameSize=_LOBBY_BUTTON_SIZE,
                 command=self._toggle_ready,
-                parent=self.area.getCanvas(),
+                parent=parent,
             )
             ready_btn.setPos(0, 0, btn_y)
             self._dynamic_elements.append(ready_btn)
+            self.ready_btn = ready_btn
             btn_y -= 0.18
 
         # Start Game button - only for host
         if is_host:
-            # Check if we need more players
-            need_players = not room or len(room.players) < 2
-            # Check if all non-host players are ready
-            others_ready = room and all(p.is_ready for p in room.players if not p.is_host)
-            start_enabled = not need_players and others_ready
-
-            if need_players:
-                status_text = "Waiting for player..."
-            elif not others_ready:
-                status_text = "Waiting for ready..."
-            else:
-                status_text = "START GAME"
-
             start_btn = DirectButton(
-                text=status_text,
+                text="",
                 text_align=TextNode.ACenter,
                 text_font=font,
                 scale=BUTTON_TEXT_SCALE * 1.3,
                 relief=DGG.RIDGE,
-                frameColor=(0.8, 0.6, 0.1, 1) if start_enabled else (0.3, 0.3, 0.3, 1),
-                frameSize=(-0.4, 0.4, -0.07, 0.09),
-                command=self._start_game if start_enabled else None,
-                parent=self.area.getCanvas(),
+                frameColor=_DISABLED_BUTTON_COLOR,
+                frameSize=_LOBBY_BUTTON_SIZE,
+                command=None,
+                parent=parent,
             )
             start_btn.setPos(0, 0, btn_y)
-            if not start_enabled:
-                start_btn["state"] = DGG.DISABLED
             self._dynamic_elements.append(start_btn)
+            self.start_btn = start_btn
 
         # Leave button
         btn_y -= 0.15
@@ -674,38 +1261,73 @@ class MultiplayerLobbyMenu(BaseMenu):
             text_font=font,
             scale=BUTTON_TEXT_SCALE * 0.8,
             relief=DGG.RIDGE,
-            frameColor=(0.5, 0.3, 0.3, 1),
+            frameColor=_LEAVE_BUTTON_COLOR,
             frameSize=(-0.3, 0.3, -0.05, 0.07),
             command=self._leave_room,
-            parent=self.area.getCanvas(),
+            parent=parent,
         )
         self._dynamic_elements.append(leave_btn)
         leave_btn.setPos(0, 0, btn_y)
 
+        # Error message, shown on refresh when there is one
+        error_label = _mk_label(
+            parent,
+            "",
+            BUTTON_TEXT_SCALE * 0.5,
+            (0, 0, -0.7),
+            _LOBBY_ERROR_COLOR,
+            font,
+        )
+        error_label.hide()
+        self._dynamic_elements.append(error_label)
+        self.error_label = error_label
+
+    def _refresh_from_room(self, room: RoomInfo | None, client) -> None:
+        """Update the mutable parts of an already built lobby from the room state."""
+        self._last_room_state = _room_state(room, client)
+
+        if self.share_label is not None:
+            mp_menu = MenuRegistry.get_menu("multiplayer")
+            share_address, is_public = mp_menu.share_address, mp_menu.share_is_public
+            self._share_address = share_address  # Store for copy button
+
+            self.share_label["text"] = f"Share: {share_address}"
+            self.share_label["text_fg"] = (
+                _SHARE_TEXT_COLOR if is_public else _LAN_SHARE_TEXT_COLOR
+            )
+            self.mode_label["text"] = "(Internet)" if is_public else "(LAN only)"
+            self.mode_label["text_fg"] = (
+                _PUBLIC_MODE_COLOR if is_public else _LAN_MODE_COLOR
+            )
+
+        if room and room.players:
+            self.waiting_label.hide()
+            me = self._refresh_players(room, client)
+            if me is not None:
+                self._refresh_ready_state(me.is_ready)
+        else:
+            self.waiting_label.show()
+            self._hide_player_slots()
+
+        self._refresh_start_button(room)
+
         # Show error message if any
         if self._last_error:
-            error_label = DirectLabel(
-                text=f"Error: {self._last_error}",
-                scale=BUTTON_TEXT_SCALE * 0.5,
-                relief=None,
-                text_fg=(0.9, 0.3, 0.3, 1),
-                text_align=TextNode.ACenter,
-                text_font=font,
-                parent=self.area.getCanvas(),
-            )
-            error_label.setPos(0, 0, -0.7)
-            self._dynamic_elements.append(error_label)
+            self.error_label["text"] = f"Error: {self._last_error}"
+            self.error_label.show()
             # Clear error after displaying
             self._last_error = None
+        else:
+            self.error_label.hide()
 
     def _copy_share_link(self) -> None:
         """Copy the share link to clipboard."""
-        if hasattr(self, "_share_address") and self._share_address:
+        if self._share_address:
             success = copy_to_clipboard(self._share_address)
-            if success and hasattr(self, "_copy_btn"):
+            if success and self._copy_btn is not None:
                 # Update button text to show success
                 self._copy_btn["text"] = "Copied!"
-                self._copy_btn["frameColor"] = (0.2, 0.7, 0.2, 1)
+                self._copy_btn["frameColor"] = _READY_BUTTON_COLOR
                 # Reset after 2 seconds
                 Global.task_mgr.doMethodLater(
                     2.0,
@@ -715,43 +1337,169 @@ class MultiplayerLobbyMenu(BaseMenu):
 
     def _reset_copy_btn(self) -> None:
         """Reset copy button text after showing 'Copied!'"""
-        if hasattr(self, "_copy_btn") and self._copy_btn:
+        if self._copy_btn is not None:
             try:
                 self._copy_btn["text"] = "Copy Link"
-                self._copy_btn["frameColor"] = (0.3, 0.5, 0.3, 1)
+                self._copy_btn["frameColor"] = _COPY_BUTTON_COLOR
             except Exception:
                 pass  # Button may have been destroyed
 
     def _toggle_ready(self) -> None:
         """Toggle ready status."""
-        from pooltool.ani.menu._registry import MenuRegistry
-
         mp_menu = MenuRegistry.get_menu("multiplayer")
-        if mp_menu and hasattr(mp_menu, "client") and mp_menu.client:
+        if mp_menu is not None and mp_menu.client is not None:
             client = mp_menu.client
-            if client.current_room:
-                for p in client.current_room.players:
-                    if p.player_id == client.player_id:
-                        client.set_ready(not p.is_ready)
-                        # Refresh the lobby display
-                        MenuNavigator.go_to_menu("multiplayer_lobby")()
-                        break
+            room, me = client.current_room, client.my_player
+            if room is not None and me is not None:
+                # Flip locally so the UI responds immediately. The server's room
+                # update confirms it. Going through the room keeps its ready count,
+                # and so the start button, in step.
+                is_ready = not me.is_ready
+                room.set_ready(me.player_id, is_ready)
+                client.all_ready = room.all_ready
+                client.set_ready(is_ready)
+                Global.base.messenger.send(LOBBY_STATE_CHANGED, [room])
+
+    def _refresh_ready_state(self, is_ready: bool) -> None:
+        """Patch the ready button to reflect the player's ready status."""
+        if self.ready_btn is None:
+            return
+
+        self.ready_btn["text"] = "NOT READY" if is_ready else "READY!"
+        self.ready_btn["frameColor"] = (
+            _UNREADY_BUTTON_COLOR if is_ready else _READY_BUTTON_COLOR
+        )
+
+    def _update_players_in_place(self, room: RoomInfo, client) -> bool:
+        """Patch the player list and buttons without rebuilding the lobby.
+
+        Only possible when the player list is already on screen, i.e. the lobby isn't
+        showing its "waiting" placeholder.
+
+        Returns:
+            True if the lobby was updated in place, False if it needs a rebuild.
+        """
+        if not self._showing_players or not room.players:
+            return False
+
+        self._last_room_state = _room_state(room, client)
+        me = self._refresh_players(room, client)
+        is_host = me is not None and me.is_host
+        if me is not None:
+            self._refresh_ready_state(me.is_ready)
+
+        # Host handover swaps which of the ready/start buttons exists
+        if is_host != (self.start_btn is not None):
+            return False
+
+        self._refresh_start_button(room)
+        return True
+
+    def _refresh_start_button(self, room: RoomInfo | None) -> None:
+        """Patch the host's start button to reflect the room state."""
+        if self.start_btn is None:
+            return
+
+        status_text, start_enabled = _start_button_state(
+            room, MenuRegistry.shared_client
+        )
+        self.start_btn["text"] = status_text
+        self.start_btn["frameColor"] = (
+            _START_BUTTON_COLOR if start_enabled else _DISABLED_BUTTON_COLOR
+        )
+        self.start_btn["command"] = self._start_game if start_enabled else None
+        self.start_btn["state"] = DGG.NORMAL if start_enabled else DGG.DISABLED
+
+    def _ensure_player_slots(self, font) -> None:
+        """Create the pooled player list labels, hidden, if they don't exist yet."""
+        if self._player_slots:
+            return
+
+        for _ in range(MAX_PLAYERS):
+            name_label = _mk_label(
+                self.area.getCanvas(),
+                "",
+                BUTTON_TEXT_SCALE * 0.65,
+                (0, 0, 0),
+                TEXT_COLOR,
+                font,
+            )
+            status_label = _mk_label(
+                self.area.getCanvas(),
+                "",
+                BUTTON_TEXT_SCALE * 0.45,
+                (0, 0, 0),
+                TEXT_COLOR,
+                font,
+            )
+            name_label.hide()
+            status_label.hide()
+            self._player_slots.append((name_label, status_label))
+
+    def _hide_player_slots(self) -> None:
+        """Hide the player list and release every slot."""
+        for name_label, status_label in self._player_slots:
+            name_label.hide()
+            status_label.hide()
+        self._player_widgets.clear()
+        self._showing_players = False
+
+    def _refresh_players(self, room: RoomInfo, client) -> PlayerInfo | None:
+        """Fill the pooled player labels from the room.
+
+        Players keep their slot across refreshes. Slots of departed players are
+        hidden and handed to newly joined ones, and labels are only written when
+        their content changed.
+
+        Returns:
+            The local player's entry, if they are in the room.
+        """
+        players = room.players[:MAX_PLAYERS]
+        present = {p.player_id for p in players}
+        for player_id in [pid for pid in self._player_widgets if pid not in present]:
+            for label in self._player_widgets.pop(player_id):
+                label.hide()
+
+        taken = {id(slot) for slot in self._player_widgets.values()}
+        free = [slot for slot in self._player_slots if id(slot) not in taken]
+
+        me = None
+        y_pos = self._players_top
+        for player in players:
+            is_you = client is not None and player.player_id == client.player_id
+            if is_you:
+                me = player
+
+            slot = self._player_widgets.get(player.player_id)
+            if slot is None:
+                slot = self._player_widgets[player.player_id] = free.pop()
+            name_label, status_label = slot
+
+            _set_label(name_label, *_player_name_style(player, is_you))
+            name_label.setZ(y_pos)
+            name_label.show()
+
+            # Ready status on separate line
+            _set_label(status_label, *_player_status_style(player))
+            status_label.setZ(y_pos - 0.07)
+            status_label.show()
+
+            y_pos -= 0.18
+
+        self._showing_players = True
+        return me
 
     def _start_game(self) -> None:
         """Start the multiplayer game (host only)."""
-        from pooltool.ani.menu._registry import MenuRegistry
-
         mp_menu = MenuRegistry.get_menu("multiplayer")
-        if mp_menu and hasattr(mp_menu, "client") and mp_menu.client:
+        if mp_menu is not None and mp_menu.client is not None:
             # Send start game message to server - server will broadcast to all players
             mp_menu.client.start_game()
 
     def _leave_room(self) -> None:
         """Leave the current room."""
-        from pooltool.ani.menu._registry import MenuRegistry
-
         mp_menu = MenuRegistry.get_menu("multiplayer")
-        if mp_menu and hasattr(mp_menu, "client") and mp_menu.client:
+        if mp_menu is not None and mp_menu.client is not None:
             mp_menu.client.leave_room()
 
         self._callbacks_registered = False
@@ -763,10 +1511,9 @@ class MultiplayerLobbyMenu(BaseMenu):
         lobby = self
 
         def on_room_update(room):
-            # Update local room state
-            client.current_room = room
-            # Refresh lobby UI if still in lobby
-            lobby._refresh_lobby()
+            # The client has already updated `current_room`. Let the lobby refresh
+            # itself if it's showing.
+            Global.base.messenger.send(LOBBY_STATE_CHANGED, [room])
 
         def on_game_start(game_state):
             # Transition to game
@@ -780,10 +1527,22 @@ class MultiplayerLobbyMenu(BaseMenu):
         client.on_game_start = on_game_start
         client.on_error = on_error
 
+    def _on_lobby_state_changed(self, room: RoomInfo) -> None:
+        """Apply a room state change, patching widgets in place when possible."""
+        if MenuRegistry.get_current_menu() is not self:
+            return
+
+        # The server echoes our own changes back, which would repaint nothing new
+        client = MenuRegistry.shared_client
+        if _room_state(room, client) == self._last_room_state:
+            return
+
+        if not self._update_players_in_place(room, client):
+            self._refresh_lobby()
+
     def _refresh_lobby(self) -> None:
         """Refresh the lobby display."""
         # Only refresh if we're currently showing the lobby
-        from pooltool.ani.menu._registry import MenuRegistry
         current = MenuRegistry.get_current_menu()
         if current and current.name == "multiplayer_lobby":
             # Re-populate to refresh the UI
@@ -801,7 +1560,10 @@ class MultiplayerLobbyMenu(BaseMenu):
         self._refresh_lobby()
 
     def hide(self) -> None:
-        """Clean up when hiding lobby menu."""
-        self._clear_dynamic_elements()
+        """Clean up when hiding lobby menu.
+
+        The lobby widgets are kept (hidden along with the scrolled area) so the next
+        show only has to refresh them.
+        """
         self._callbacks_registered = False
         super().hide()
@@ -1,6 +1,8 @@
 #! /usr/bin/env python
 """Splash screen mode displaying 'X presents' before the main menu."""
 
+import threading
+
 from direct.gui.DirectGui import DirectFrame, DirectLabel
 from direct.gui.OnscreenImage import OnscreenImage
 from panda3d.core import TextNode, TransparencyAttrib
@@ -10,8 +12,17 @@ from pooltool.ani.action import Action
 from pooltool.ani.constants import logo_paths
 from pooltool.ani.fonts import load_font
 from pooltool.ani.globals import Global
+from pooltool.ani.menu._datatypes import BUTTON_FONT, MENU_ASSETS, TITLE_FONT
+from pooltool.ani.menu.menus.multiplayer import get_local_ip, prefetch_pyngrok
 from pooltool.ani.modes.datatypes import BaseMode, Mode
 from pooltool.ani.mouse import MouseMode, mouse
+from pooltool.utils import panda_path
+
+
+def _prefetch_in_background() -> None:
+    """Warm up the slow, thread-safe parts of opening the menus."""
+    get_local_ip()
+    prefetch_pyngrok()
 
 
 class SplashMode(BaseMode):
@@ -31,10 +42,14 @@ class SplashMode(BaseMode):
         self.online_label = None
         self.fade_task_name = "splash_fade_task"
         self.auto_advance_task_name = "splash_auto_advance"
+        self.prefetch_task_name = "splash_prefetch"
 
     def enter(self):
         mouse.mode(MouseMode.ABSOLUTE)
 
+        # Warm up slow lookups and imports while the splash is on screen
+        threading.Thread(target=_prefetch_in_background, daemon=True).start()
+
         # Create full-screen backdrop
         self.splash_frame = DirectFrame(
             frameColor=(0.02, 0.02, 0.02, 1),
@@ -78,22 +93,23 @@ class SplashMode(BaseMode):
             text_align=TextNode.ACenter,
         )
 
-        # Register events to skip splash
+        # Register events to skip splash. There are no "-up" handlers, so a press
+        # stays latched until the (infrequent) poll below sees it.
         self.register_keymap_event("escape", Action.exit, True)
-        self.register_keymap_event("escape-up", Action.exit, False)
         self.register_keymap_event("mouse1", Action.click, True)
-        self.register_keymap_event("mouse1-up", Action.click, False)
         self.register_keymap_event("space", Action.click, True)
-        self.register_keymap_event("space-up", Action.click, False)
         self.register_keymap_event("enter", Action.click, True)
-        self.register_keymap_event("enter-up", Action.click, False)
 
-        # Task to check for skip input
-        tasks.add(self.splash_task, "splash_task")
+        # Check for skip input at 10 Hz. Nothing animates on the splash, and 100 ms
+        # is below what a user notices for a skip.
+        tasks.add_later(0.1, self.splash_task, "splash_task")
 
         # Auto-advance after 3 seconds
         tasks.add_later(3.0, self._auto_advance, self.auto_advance_task_name)
 
+        # Load the menus' assets once the splash has been drawn
+        tasks.add_later(0.2, self._prefetch_assets, self.prefetch_task_name)
+
     def exit(self):
         # Clean up UI elements
         if self.splash_frame:
@@ -115,6 +131,7 @@ class SplashMode(BaseMode):
         # Remove tasks
         tasks.remove("splash_task")
         tasks.remove(self.auto_advance_task_name)
+        tasks.remove(self.prefetch_task_name)
 
     def splash_task(self, task):
         """Check for user input to skip the splash screen."""
@@ -122,7 +139,19 @@ class SplashMode(BaseMode):
             self._go_to_menu()
             return task.done
 
-        return task.cont
+        return task.again
+
+    def _prefetch_assets(self, task):
+        """Load fonts and textures the menus need, so the first menu opens smoothly.
+
+        This happens on the main thread, since that's where Panda3D's loader is used
+        everywhere else. Fonts and textures are cached, so the menus reuse them.
+        """
+        load_font(BUTTON_FONT)
+        load_font(TITLE_FONT)
+        Global.loader.loadTexture(panda_path(MENU_ASSETS / "menu_background.jpeg"))
+        Global.loader.loadTexture(panda_path(logo_paths["default"]))
+        return task.done
 
     def _auto_advance(self, task):
         """Automatically advance to menu after timeout."""
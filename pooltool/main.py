@@ -14,13 +14,18 @@ def run(monitor, fast):
     # Apply performance mode settings before creating the game
     if fast:
         from pooltool.config import settings
-        # Reduce graphics for performance
-        settings.graphics.shader = False
-        settings.graphics.room = False
-        settings.graphics.shadows = False
-        settings.graphics.max_lights = 2
-        settings.graphics.fps = 60
-        settings.system.window_width = 1200
+
+        # Reduce graphics for performance. The settings proxy resolves every attribute
+        # access, so fetch each config once. They're updated in place rather than
+        # replaced (attrs.evolve) since assigning to the proxy wouldn't reach its
+        # cached settings.
+        graphics, system = settings.graphics, settings.system
+        graphics.shader = False
+        graphics.room = False
+        graphics.shadows = False
+        graphics.max_lights = 2
+        graphics.fps = 60
+        system.window_width = 1200
         click.echo("🚀 Performance mode enabled")
 
     config = attrs.evolve(ShowBaseConfig.default(), monitor=monitor)
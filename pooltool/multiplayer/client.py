@@ -4,27 +4,121 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import socket
 import threading
 import time
+from collections import deque
 from collections.abc import Callable
-from queue import Empty, Queue
+from functools import partial
 from typing import Any
 
 import attrs
 
 from pooltool.multiplayer.protocol import (
+    FRAME_HEADER,
+    MAX_FRAME_SIZE,
+    PROTOCOL_VERSION,
     CueState,
     GameMessage,
     GameState,
     MessageType,
     PlayerInfo,
     RoomInfo,
+    encode_frame,
 )
 
+# uvloop is a drop-in, faster event loop for the network thread. It's optional, with
+# the stdlib loop as fallback.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+class _ClientProtocol(asyncio.Protocol):
+    """Framed transport callbacks for `MultiplayerClient`.
+
+    `data_received` only finds frame boundaries in one receive buffer, with none of
+    the per-read Future round trips of `StreamReader`. Complete frames are handed
+    on undecoded, so a large payload never holds up the socket while it's parsed.
+    """
+
+    def __init__(self, on_frames: Callable[[bytes], None]) -> None:
+        self._on_frames = on_frames
+        self._recv_buf = bytearray()
+        self._drain_waiter: asyncio.Future[None] | None = None
+        self.transport: asyncio.Transport | None = None
+        self.closed: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        buf = self._recv_buf
+        buf += data
+
+        # Find where the last complete frame ends
+        end = 0
+        header_size = FRAME_HEADER.size
+        while len(buf) - end >= header_size:
+            _, length = FRAME_HEADER.unpack_from(buf, end)
+            if length > MAX_FRAME_SIZE:
+                logger.error(f"Dropping connection: {length} byte frame is too big")
+                assert self.transport is not None
+                self.transport.close()
+                return
+            if len(buf) < end + header_size + length:
+                break
+            end += header_size + length
+
+        if not end:
+            return
+
+        # Hand every complete frame over as one chunk: a single copy per read, not
+        # per message. The view must be released before the buffer resizes.
+        if end == len(buf):
+            chunk = bytes(buf)
+            buf.clear()
+        else:
+            with memoryview(buf) as view, view[:end] as frames:
+                chunk = bytes(frames)
+            del buf[:end]
+        self._on_frames(chunk)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if not self.closed.done():
+            self.closed.set_result(None)
+        self._wake_drain()
+
+    def pause_writing(self) -> None:
+        if self._drain_waiter is None:
+            self._drain_waiter = asyncio.get_running_loop().create_future()
+
+    def resume_writing(self) -> None:
+        self._wake_drain()
+
+    def _wake_drain(self) -> None:
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def drain(self) -> None:
+        """Wait until the transport's write buffer is below its high-water mark."""
+        if self._drain_waiter is not None:
+            await self._drain_waiter
+
+
 @attrs.define
 class MultiplayerClient:
     """Client for connecting to multiplayer pool game servers.
@@ -43,11 +137,19 @@ class MultiplayerClient:
     player_id: str = ""
     player_name: str = ""
 
+    # Whether to open a second connection for bulky messages, see `send_shot_result`
+    use_bulk_channel: bool = True
+
     # Connection state
     is_connected: bool = False
     current_room: RoomInfo | None = None
     game_state: GameState | None = None
 
+    # Derived from current_room whenever it changes, so the UI doesn't have to scan
+    # the player list
+    my_player: PlayerInfo | None = None
+    all_ready: bool = False
+
     # Callbacks for events
     on_connected: Callable[[str], None] | None = None
     on_disconnected: Callable[[], None] | None = None
@@ -62,15 +164,67 @@ class MultiplayerClient:
     on_error: Callable[[str], None] | None = None
 
     # Internal state
-    _reader: asyncio.StreamReader | None = attrs.field(default=None, repr=False)
-    _writer: asyncio.StreamWriter | None = attrs.field(default=None, repr=False)
+    _transport: asyncio.Transport | None = attrs.field(default=None, repr=False)
+    _protocol: _ClientProtocol | None = attrs.field(default=None, repr=False)
+    _bulk_transport: asyncio.Transport | None = attrs.field(default=None, repr=False)
+    _bulk_ready: bool = attrs.field(default=False, repr=False)
     _loop: asyncio.AbstractEventLoop | None = attrs.field(default=None, repr=False)
     _thread: threading.Thread | None = attrs.field(default=None, repr=False)
+    _listen_task: asyncio.Task | None = attrs.field(default=None, repr=False)
+    # Set once the network thread has flushed, closed the connection, and finished
+    _stopped: threading.Event = attrs.field(factory=threading.Event, repr=False)
     _running: bool = attrs.field(default=False, repr=False)
-    _message_queue: Queue = attrs.field(factory=Queue, repr=False)
+    # Chunks of complete, still-encoded frames from the network thread, decoded by
+    # `update` on the main thread
+    _message_queue: deque[bytes] = attrs.field(factory=deque, repr=False)
+    _queue_lock: threading.Lock = attrs.field(factory=threading.Lock, repr=False)
+    # Outbound lines, queued from any thread and written in batches by `_write_loop`
+    _outbound: deque[bytes] = attrs.field(factory=deque, repr=False)
+    _outbound_lock: threading.Lock = attrs.field(factory=threading.Lock, repr=False)
+    _outbound_event: asyncio.Event | None = attrs.field(default=None, repr=False)
+    # Wakes `_write_loop` from any thread. Doubles as the one check for whether sends
+    # are accepted: it's only set while the connection is up and the writer running.
+    _wake_writer: Callable[[], Any] | None = attrs.field(default=None, repr=False)
+    # Whether a wakeup of `_write_loop` is already on its way; guarded by
+    # `_outbound_lock` and cleared when the writer takes the queue
+    _wakeup_pending: bool = attrs.field(default=False, repr=False)
+    # Latest-wins aim preview slot, sent at most once per `_aim_interval` seconds
+    _pending_aim: CueState | None = attrs.field(default=None, repr=False)
+    _aim_buffer: CueState | None = attrs.field(default=None, repr=False)
+    _last_aim_time: float = attrs.field(default=0.0, repr=False)
+    _aim_interval: float = attrs.field(default=0.016, repr=False)
+    _aim_timer: asyncio.TimerHandle | None = attrs.field(default=None, repr=False)
     _last_pong_time: float = attrs.field(default=0.0, repr=False)
     _ping_interval: float = attrs.field(default=5.0, repr=False)  # Send ping every 5 seconds
     _ping_timeout: float = attrs.field(default=15.0, repr=False)  # Disconnect if no pong for 15 seconds
+    _message_handlers: dict[MessageType, Callable[[GameMessage], None]] = attrs.field(
+        init=False, factory=dict, repr=False
+    )
+
+    def __attrs_post_init__(self) -> None:
+        # Built once rather than per message, like the server's handler table
+        self._message_handlers = {
+            MessageType.CONNECT: self._on_connect,
+            MessageType.ROOM_UPDATE: self._on_room_update,
+            MessageType.ROOM_LIST: self._on_room_list,
+            MessageType.CREATE_ROOM: self._on_create_room,
+            MessageType.JOIN_ROOM: self._on_join_room,
+            MessageType.LEAVE_ROOM: self._on_leave_room,
+            MessageType.GAME_START: self._on_game_start,
+            MessageType.SHOT_AIM: self._on_shot_aim,
+            MessageType.SHOT_EXECUTE: self._on_shot_execute,
+            MessageType.TURN_CHANGE: self._on_turn_change,
+            MessageType.GAME_OVER: self._on_game_over,
+            MessageType.CHAT_MESSAGE: self._on_chat_message,
+            MessageType.PONG: self._on_pong,
+            MessageType.ERROR: self._on_error,
+            MessageType.BULK_ATTACH: self._on_bulk_attach,
+        }
+
+    @property
+    def endpoint(self) -> tuple[str, int]:
+        """The (host, port) of the server this client connects to."""
+        return (self.host, self.port)
 
     def connect(self, host: str, port: int, name: str) -> bool:
         """Connect to a multiplayer server.
@@ -87,6 +241,7 @@ class MultiplayerClient:
         self.port = port
         self.player_name = name
         self._running = True
+        self._stopped.clear()
 
         # Start network thread
         self._thread = threading.Thread(target=self._run_network_loop, daemon=True)
@@ -100,13 +255,22 @@ class MultiplayerClient:
             return
 
         self._send_message(MessageType.DISCONNECT, {})
+        self._wake_writer = None
         self._running = False
         self.is_connected = False
 
+        # Wake the network thread rather than wait for it to notice `_running`. The
+        # queued DISCONNECT is flushed on the way out, which normally takes a few
+        # milliseconds; the network thread is a daemon, so a slow flush is left to
+        # finish in the background rather than stall the UI.
+        if self._loop and self._listen_task:
+            with contextlib.suppress(RuntimeError):  # Loop already closed
+                self._loop.call_soon_threadsafe(self._listen_task.cancel)
+
         if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=2.0)
+            self._stopped.wait(timeout=0.25)
 
-        self.current_room = None
+        self._set_room(None)
         self.game_state = None
 
         if self.on_disconnected:
@@ -135,7 +299,7 @@ class MultiplayerClient:
     def leave_room(self) -> None:
         """Leave the current room."""
         self._send_message(MessageType.LEAVE_ROOM, {})
-        self.current_room = None
+        self._set_room(None)
 
     def request_room_list(self) -> None:
         """Request list of available rooms from server."""
@@ -172,15 +336,34 @@ class MultiplayerClient:
             b: English vertical offset.
             cue_ball_id: ID of the cue ball.
         """
-        cue_state = CueState(
-            phi=phi,
-            theta=theta,
-            V0=V0,
-            a=a,
-            b=b,
-            cue_ball_id=cue_ball_id,
-        )
-        self._send_message(MessageType.SHOT_AIM, {"cue_state": attrs.asdict(cue_state)})
+        # Previews are lossy: only the latest aim matters, so it replaces any aim
+        # that hasn't gone out yet and `_write_loop` sends it at a capped rate
+        wake_writer = self._wake_writer
+        if wake_writer is not None:
+            with self._outbound_lock:
+                # Aims come in every frame, so one CueState is overwritten rather
+                # than a new one allocated per call
+                aim = self._aim_buffer
+                if aim is None:
+                    aim = self._aim_buffer = CueState(
+                        phi=phi,
+                        theta=theta,
+                        V0=V0,
+                        a=a,
+                        b=b,
+                        cue_ball_id=cue_ball_id,
+                    )
+                else:
+                    aim.phi = phi
+                    aim.theta = theta
+                    aim.V0 = V0
+                    aim.a = a
+                    aim.b = b
+                    aim.cue_ball_id = cue_ball_id
+                self._pending_aim = aim
+                wake = self._claim_wakeup()
+            if wake:
+                wake_writer()
 
     def send_shot_execute(
         self,
@@ -209,9 +392,13 @@ class MultiplayerClient:
             b=b,
             cue_ball_id=cue_ball_id,
         )
+
+        # An aim preview still pending would arrive after the shot it previews
+        with self._outbound_lock:
+            self._pending_aim = None
         self._send_message(
             MessageType.SHOT_EXECUTE,
-            {"cue_state": attrs.asdict(cue_state)},
+            {"cue_state": cue_state.to_dict()},
         )
 
     def send_shot_result(
@@ -225,6 +412,9 @@ class MultiplayerClient:
     ) -> None:
         """Send shot result after simulation.
 
+        Results go over the bulk channel when it's up, so a large one can't hold up
+        aim previews on the main connection.
+
         Args:
             ball_positions: Final positions of all balls.
             ball_states: States of all balls.
@@ -233,7 +423,7 @@ class MultiplayerClient:
             is_game_over: Whether the game has ended.
             winner_id: ID of the winner if game is over.
         """
-        self._send_message(
+        self._send_bulk(
             MessageType.SHOT_RESULT,
             {
                 "ball_positions": ball_positions,
@@ -255,12 +445,50 @@ class MultiplayerClient:
 
     def update(self) -> None:
         """Process pending messages. Call this from the main thread."""
-        while True:
-            try:
-                msg = self._message_queue.get_nowait()
+        if not self._message_queue:
+            return
+
+        for chunk in self._drain_all():
+            for msg in _decode_frames(chunk):
                 self._handle_message(msg)
-            except Empty:
-                break
+
+    def _drain_all(self) -> deque[bytes]:
+        """Take every pending message at once, with a single lock acquisition."""
+        with self._queue_lock:
+            batch, self._message_queue = self._message_queue, deque()
+        return batch
+
+    def _enqueue(self, chunk: bytes) -> None:
+        """Hand encoded frames from the network thread to `update`."""
+        with self._queue_lock:
+            self._message_queue.append(chunk)
+
+    def _enqueue_error(self, error: str) -> None:
+        """Report a client-side error through `update`, like one from the server."""
+        self._enqueue(
+            encode_frame(MessageType.ERROR, "client", {"error": error}, time.time())
+        )
+
+    def set_socket_option(self, level: int, option: int, value: int) -> bool:
+        """Set an option on the underlying TCP socket.
+
+        Args:
+            level: Protocol level (e.g. ``socket.IPPROTO_TCP``).
+            option: Option name (e.g. ``socket.TCP_NODELAY``).
+            value: Option value.
+
+        Returns:
+            True if the option was applied, False if there is no open socket.
+        """
+        if not self._transport:
+            return False
+
+        sock = self._transport.get_extra_info("socket")
+        if sock is None:
+            return False
+
+        sock.setsockopt(level, option, value)
+        return True
 
     def is_my_turn(self) -> bool:
         """Check if it's this player's turn."""
@@ -270,35 +498,139 @@ class MultiplayerClient:
 
     def _send_message(self, msg_type: MessageType, data: dict[str, Any]) -> None:
         """Queue a message to be sent to the server."""
-        if not self._writer:
+        wake_writer = self._wake_writer
+        if wake_writer is None:
+            return
+
+        line = self._encode(msg_type, data)
+        if line is None:
             return
 
-        message = GameMessage(
-            msg_type=msg_type,
-            sender_id=self.player_id,
-            data=data,
-            timestamp=time.time(),
+        with self._outbound_lock:
+            self._outbound.append(line)
+            wake = self._claim_wakeup()
+        if wake:
+            wake_writer()
+
+    def _claim_wakeup(self) -> bool:
+        """Whether the caller must wake `_write_loop`. Call with `_outbound_lock` held.
+
+        Only the first producer after the writer last took the queue schedules a
+        wakeup; everything queued after it rides along in the same batch, saving a
+        `call_soon_threadsafe` (and its self-pipe write) per message.
+        """
+        if self._wakeup_pending:
+            return False
+        self._wakeup_pending = True
+        return True
+
+    def _send_bulk(self, msg_type: MessageType, data: dict[str, Any]) -> None:
+        """Send a message on the bulk channel, or the main connection without one."""
+        transport = self._bulk_transport
+        if not (self._bulk_ready and transport and self._loop and self._running):
+            self._send_message(msg_type, data)
+            return
+
+        if frame := self._encode(msg_type, data):
+            self._loop.call_soon_threadsafe(transport.write, frame)
+
+    async def _open_bulk_channel(self, token: str) -> None:
+        """Connect the bulk channel, which `_on_bulk_attach` marks ready when acked."""
+        loop = asyncio.get_running_loop()
+        try:
+            transport, protocol = await loop.create_connection(
+                lambda: _ClientProtocol(self._enqueue),
+                self.host,
+                self.port,
+            )
+        except OSError as e:
+            logger.warning(f"No bulk channel, using the main connection: {e}")
+            return
+
+        if not self._running:
+            transport.close()
+            return
+
+        self._bulk_transport = transport
+        protocol.closed.add_done_callback(lambda _: self._drop_bulk_channel(transport))
+        transport.write(
+            encode_frame(
+                MessageType.BULK_ATTACH, self.player_id, {"token": token}, time.time()
+            )
         )
 
+    def _drop_bulk_channel(self, transport: asyncio.Transport) -> None:
+        if self._bulk_transport is transport:
+            self._bulk_transport = None
+            self._bulk_ready = False
+
+    def _encode(self, msg_type: MessageType, data: dict[str, Any]) -> bytes | None:
+        """Serialize a message from this client into a wire frame."""
         try:
-            json_data = message.to_json() + "\n"
-            if self._loop and self._running:
-                asyncio.run_coroutine_threadsafe(
-                    self._async_send(json_data.encode()),
-                    self._loop,
-                )
+            return encode_frame(msg_type, self.player_id, data, time.time())
         except Exception as e:
             logger.error(f"Error sending message: {e}")
+            return None
 
-    async def _async_send(self, data: bytes) -> None:
-        """Async send data to server."""
-        if self._writer:
-            self._writer.write(data)
-            await self._writer.drain()
+    def _take_aim(self) -> bytes:
+        """Take the pending aim preview, if it's due under the aim rate cap.
+
+        If an aim is pending but not yet due, a wakeup of `_write_loop` is scheduled
+        for when it is.
+        """
+        assert self._loop is not None and self._outbound_event is not None
+
+        now = time.monotonic()
+        with self._outbound_lock:
+            cue_state = self._pending_aim
+            if cue_state is None:
+                return b""
+
+            wait = self._last_aim_time + self._aim_interval - now
+            if wait <= 0:
+                self._pending_aim = None
+                self._last_aim_time = now
+                # Snapshot under the lock, since `send_shot_aim` reuses the object
+                data = {"cue_state": cue_state.to_dict()}
+
+        if wait > 0:
+            if self._aim_timer is None:
+                self._aim_timer = self._loop.call_later(wait, self._aim_due)
+            return b""
+
+        return self._encode(MessageType.SHOT_AIM, data) or b""
+
+    def _aim_due(self) -> None:
+        assert self._outbound_event is not None
+        self._aim_timer = None
+        self._outbound_event.set()
+
+    def _take_outbound(self) -> bytes:
+        """Take every queued outbound line, joined into one buffer."""
+        with self._outbound_lock:
+            batch, self._outbound = self._outbound, deque()
+            self._wakeup_pending = False
+        return b"".join(batch)
+
+    async def _write_loop(self) -> None:
+        """Write queued outbound messages, coalescing whatever queued up meanwhile.
+
+        One write and drain per wakeup rather than per message, which matters for
+        the high-frequency aim previews.
+        """
+        assert self._transport is not None and self._protocol is not None
+        assert self._outbound_event is not None
+
+        while self._running:
+            await self._outbound_event.wait()
+            self._outbound_event.clear()
+            if buf := self._take_outbound() + self._take_aim():
+                self._transport.write(buf)
+                await self._protocol.drain()
 
     def _run_network_loop(self) -> None:
         """Run the async network loop in a thread."""
-        self._loop = asyncio.new_event_loop()
+        self._loop = _new_event_loop()
         asyncio.set_event_loop(self._loop)
 
         try:
@@ -307,124 +639,110 @@ class MultiplayerClient:
             logger.error(f"Network loop error: {e}")
         finally:
             self._loop.close()
+            self._stopped.set()
 
     async def _connect_and_listen(self) -> None:
         """Connect to server and listen for messages."""
+        writer_task: asyncio.Task | None = None
+        keepalive_task: asyncio.Task | None = None
+        self._listen_task = asyncio.current_task()
         try:
-            self._reader, self._writer = await asyncio.open_connection(
+            loop = asyncio.get_running_loop()
+            self._transport, self._protocol = await loop.create_connection(
+                lambda: _ClientProtocol(self._enqueue),
                 self.host,
                 self.port,
             )
+            closed = self._protocol.closed
+
+            # Aim previews are tiny, latency-sensitive writes: send them without
+            # Nagle's delay. With no write buffering in the transport, `drain` waits
+            # until the kernel has taken the bytes, so a backed-up socket makes aims
+            # pile up latest-wins in `_pending_aim` rather than stale in the buffer.
+            self.set_socket_option(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._transport.set_write_buffer_limits(high=0)
 
             # Send connect message
             connect_msg = GameMessage(
                 msg_type=MessageType.CONNECT,
                 sender_id="",
-                data={"name": self.player_name},
+                data={"name": self.player_name, "protocol": PROTOCOL_VERSION},
                 timestamp=time.time(),
             )
-            self._writer.write((connect_msg.to_json() + "\n").encode())
-            await self._writer.drain()
+            self._transport.write(connect_msg.to_frame())
 
-            # Initialize ping timing
-            self._last_pong_time = time.time()
-            last_ping_time = time.time()
+            self._outbound_event = asyncio.Event()
+            writer_task = asyncio.create_task(self._write_loop())
+            self._wake_writer = partial(
+                loop.call_soon_threadsafe, self._outbound_event.set
+            )
 
-            # Listen for messages
-            while self._running:
-                try:
-                    data = await asyncio.wait_for(
-                        self._reader.readline(),
-                        timeout=0.5,
-                    )
-                    if not data:
-                        break
-
-                    message = GameMessage.from_json(data.decode().strip())
-                    self._message_queue.put(message)
-
-                except asyncio.TimeoutError:
-                    # Check if we need to send a ping
-                    current_time = time.time()
-                    if current_time - last_ping_time >= self._ping_interval:
-                        await self._send_ping()
-                        last_ping_time = current_time
-
-                    # Check for ping timeout
-                    if current_time - self._last_pong_time > self._ping_timeout:
-                        logger.warning("Server ping timeout - disconnecting")
-                        self._message_queue.put(
-                            GameMessage(
-                                msg_type=MessageType.ERROR,
-                                sender_id="client",
-                                data={"error": "Connection timeout"},
-                                timestamp=time.time(),
-                            )
-                        )
-                        break
-                    continue
-                except Exception as e:
-                    logger.error(f"Error receiving message: {e}")
-                    break
+            self._last_pong_time = time.monotonic()
+            keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+            # Messages arrive through the protocol callbacks, so all that's left here
+            # is to wait for the connection to close, or for `disconnect` to cancel us
+            await closed
 
+        except asyncio.CancelledError:
+            pass  # `disconnect`, wherever it caught us
         except ConnectionRefusedError:
             logger.error(f"Connection refused to {self.host}:{self.port}")
-            self._message_queue.put(
-                GameMessage(
-                    msg_type=MessageType.ERROR,
-                    sender_id="client",
-                    data={"error": "Connection refused"},
-                    timestamp=time.time(),
-                )
-            )
+            self._enqueue_error("Connection refused")
+        except OSError as e:
+            # Unreachable, timed out, or the name didn't resolve
+            logger.error(f"Could not connect to {self.host}:{self.port}: {e}")
+            self._enqueue_error("Connection failed")
         except Exception as e:
             logger.error(f"Connection error: {e}")
         finally:
+            self._wake_writer = None
             self._running = False
             self.is_connected = False
 
-            if self._writer:
-                self._writer.close()
+            for task in (writer_task, keepalive_task):
+                if task is not None:
+                    task.cancel()
+
+            if self._bulk_transport:
+                self._bulk_transport.close()
+                self._drop_bulk_channel(self._bulk_transport)
+
+            if self._transport and self._protocol:
+                # Flush anything still queued, e.g. the DISCONNECT from `disconnect`
                 try:
-                    await self._writer.wait_closed()
+                    if buf := self._take_outbound():
+                        self._transport.write(buf)
                 except Exception:
                     pass
+                # Closing lets the transport flush its buffer before going away
+                self._transport.close()
+                # A cancel from `disconnect` can land here too, if the connection
+                # closed on its own at the same time
+                with contextlib.suppress(Exception, asyncio.CancelledError):
+                    await self._protocol.closed
 
-    async def _send_ping(self) -> None:
-        """Send a ping message to the server."""
-        if self._writer:
-            ping_msg = GameMessage(
-                msg_type=MessageType.PING,
-                sender_id=self.player_id,
-                data={"time": time.time()},
-                timestamp=time.time(),
-            )
-            try:
-                self._writer.write((ping_msg.to_json() + "\n").encode())
-                await self._writer.drain()
-            except Exception as e:
-                logger.error(f"Error sending ping: {e}")
+    async def _keepalive_loop(self) -> None:
+        """Ping the server periodically, and drop the connection if it goes quiet."""
+        assert self._transport is not None
+
+        while True:
+            await asyncio.sleep(self._ping_interval)
+            self._send_ping()
+
+            if time.monotonic() - self._last_pong_time > self._ping_timeout:
+                logger.warning("Server ping timeout - disconnecting")
+                self._enqueue_error("Connection timeout")
+                self._transport.close()
+                return
+
+    def _send_ping(self) -> None:
+        """Send a ping message to the server, through the outbound queue."""
+        self._send_message(MessageType.PING, {"time": time.time()})
 
     def _handle_message(self, message: GameMessage) -> None:
         """Handle an incoming message."""
-        handlers = {
-            MessageType.CONNECT: self._on_connect,
-            MessageType.ROOM_UPDATE: self._on_room_update,
-            MessageType.ROOM_LIST: self._on_room_list,
-            MessageType.CREATE_ROOM: self._on_create_room,
-            MessageType.JOIN_ROOM: self._on_join_room,
-            MessageType.LEAVE_ROOM: self._on_leave_room,
-            MessageType.GAME_START: self._on_game_start,
-            MessageType.SHOT_AIM: self._on_shot_aim,
-            MessageType.SHOT_EXECUTE: self._on_shot_execute,
-            MessageType.TURN_CHANGE: self._on_turn_change,
-            MessageType.GAME_OVER: self._on_game_over,
-            MessageType.CHAT_MESSAGE: self._on_chat_message,
-            MessageType.PONG: self._on_pong,
-            MessageType.ERROR: self._on_error,
-        }
-
-        handler = handlers.get(message.msg_type)
+        handler = self._message_handlers.get(message.msg_type)
         if handler:
             handler(message)
 
@@ -436,29 +754,56 @@ class MultiplayerClient:
             self.is_connected = True
             logger.info(f"Connected as {self.player_name} (ID: {self.player_id})")
 
+            token = message.data.get("bulk_token")
+            if token and self.use_bulk_channel and self._loop:
+                asyncio.run_coroutine_threadsafe(
+                    self._open_bulk_channel(token), self._loop
+                )
+
             if self.on_connected:
                 self.on_connected(self.player_id)
 
+    def _on_bulk_attach(self, message: GameMessage) -> None:
+        """Handle the server accepting the bulk channel."""
+        if message.data.get("success") and self._bulk_transport:
+            self._bulk_ready = True
+            logger.debug("Bulk channel ready")
+
     def _on_room_update(self, message: GameMessage) -> None:
         """Handle room update."""
         room_data = message.data.get("room", {})
         if room_data:
-            players = [
-                PlayerInfo(**p) for p in room_data.get("players", [])
-            ]
-            self.current_room = RoomInfo(
-                room_id=room_data["room_id"],
-                room_name=room_data["room_name"],
-                host_id=room_data["host_id"],
-                players=players,
-                max_players=room_data.get("max_players", 2),
-                game_type=room_data.get("game_type", "8ball"),
-                is_started=room_data.get("is_started", False),
-            )
+            room = self.current_room
+            if room is not None and room.room_id == room_data["room_id"]:
+                # Most updates are a ready toggle or a player coming or going, so
+                # patch the room we have rather than rebuild it
+                _patch_room(room, room_data)
+            else:
+                room = RoomInfo(
+                    room_id=room_data["room_id"],
+                    room_name=room_data["room_name"],
+                    host_id=room_data["host_id"],
+                    players=[PlayerInfo(**p) for p in room_data.get("players", [])],
+                    max_players=room_data.get("max_players", 2),
+                    game_type=room_data.get("game_type", "8ball"),
+                    is_started=room_data.get("is_started", False),
+                )
+            self._set_room(room)
 
             if self.on_room_update:
                 self.on_room_update(self.current_room)
 
+    def _set_room(self, room: RoomInfo | None) -> None:
+        """Set the current room and the state derived from it."""
+        self.current_room = room
+        self.my_player = None
+        self.all_ready = False
+        if room is None:
+            return
+
+        self.my_player = room.get_player(self.player_id)
+        self.all_ready = room.all_ready
+
     def _on_room_list(self, message: GameMessage) -> None:
         """Handle room list."""
         rooms = message.data.get("rooms", [])
@@ -477,7 +822,7 @@ class MultiplayerClient:
 
     def _on_leave_room(self, message: GameMessage) -> None:
         """Handle room leave response."""
-        self.current_room = None
+        self._set_room(None)
 
     def _on_game_start(self, message: GameMessage) -> None:
         """Handle game start."""
@@ -512,6 +857,7 @@ class MultiplayerClient:
         next_player_id = message.data.get("next_player_id", "")
         if self.game_state:
             self.game_state.current_player_id = next_player_id
+            self.game_state.apply_delta(message.data.get("state_delta", {}))
 
         if self.on_turn_change:
             self.on_turn_change(next_player_id)
@@ -536,7 +882,7 @@ class MultiplayerClient:
 
     def _on_pong(self, message: GameMessage) -> None:
         """Handle pong response from server."""
-        self._last_pong_time = time.time()
+        self._last_pong_time = time.monotonic()
 
     def _on_error(self, message: GameMessage) -> None:
         """Handle error message."""
@@ -545,3 +891,48 @@ class MultiplayerClient:
 
         if self.on_error:
             self.on_error(error)
+
+
+def _decode_frames(chunk: bytes) -> list[GameMessage]:
+    """Decode a chunk of complete frames, skipping (and logging) any bad payload."""
+    messages = []
+    view = memoryview(chunk)
+    header_size = FRAME_HEADER.size
+    pos = 0
+    while pos < len(chunk):
+        kind, length = FRAME_HEADER.unpack_from(chunk, pos)
+        start, pos = pos + header_size, pos + header_size + length
+        try:
+            messages.append(GameMessage.from_frame_payload(kind, view[start:pos]))
+        except Exception as e:
+            logger.error(f"Error receiving message: {e}")
+    return messages
+
+
+def _patch_room(room: RoomInfo, room_data: dict[str, Any]) -> None:
+    """Update `room` in place from a serialized room with the same ID.
+
+    Players already in the room keep their `PlayerInfo` objects, so references held
+    elsewhere (e.g. by the lobby menu) stay live. Only newcomers are allocated.
+    """
+    existing = {p.player_id: p for p in room.players}
+    players = []
+    for data in room_data.get("players", []):
+        player = existing.get(data["player_id"])
+        if player is None:
+            player = PlayerInfo(**data)
+        else:
+            player.name = data["name"]
+            player.is_ready = data.get("is_ready", False)
+            player.is_host = data.get("is_host", False)
+            player.is_connected = data.get("is_connected", True)
+        players.append(player)
+
+    room.players = players
+    room.reindex()
+    room.room_name = room_data["room_name"]
+    room.host_id = room_data["host_id"]
+    room.max_players = room_data.get("max_players", 2)
+    room.game_type = room_data.get("game_type", "8ball")
+    room.is_started = room_data.get("is_started", False)
+    room.invalidate()
@@ -4,10 +4,56 @@
 from __future__ import annotations
 
 import json
+import struct
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import Any, Final
 
 import attrs
+import msgpack
+
+# orjson is a drop-in speedup for the wire format. It's optional, with the stdlib json
+# module as fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Compact like orjson, rather than the stdlib's padded ", " and ": "
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes | bytearray | memoryview | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        # Unlike orjson, the json module doesn't take buffer views
+        data = bytes(data)
+    return json.loads(data)
+
+
+# Every message travels as one frame: a header holding a kind byte and the payload
+# length (big-endian), then the payload. The kind byte is the message type's wire
+# code (see `_TYPE_BY_CODE`) plus flags, so the payload carries only the rest of
+# the envelope, positionally: `[sender_id, timestamp, data]`. Length-prefixing
+# rather than newline delimiting is what lets payloads be binary.
+FRAME_HEADER: Final = struct.Struct(">BI")
+
+# Largest payload either side accepts; a frame announcing more is treated as a
+# broken or hostile peer, rather than buffered. Real messages are a few KB at most.
+MAX_FRAME_SIZE: Final = 1 << 20
+
+# Kind byte flag: the payload is msgpack rather than UTF-8 JSON. Everything is sent
+# as msgpack; JSON payloads are still understood.
+FLAG_MSGPACK: Final = 0x80
+
+# Bumped on any incompatible change to the wire format. Exchanged in CONNECT, and
+# the server turns away clients speaking a different version.
+PROTOCOL_VERSION: Final = 3
 
 
 class MessageType(str, Enum):
@@ -42,12 +88,27 @@ class MessageType(str, Enum):
     # Errors
     ERROR = "error"
 
+    # A second connection, attached to an existing client with the token from its
+    # CONNECT response, that carries the client's bulky messages (SHOT_RESULT) so
+    # they can't hold up the main connection's aim previews
+    BULK_ATTACH = "bulk_attach"
 
-@attrs.define
+
+# Message type wire codes are positions in `MessageType`, so new types must only
+# ever be appended to it
+_TYPE_BY_CODE: Final = tuple(MessageType)
+_CODE_BY_TYPE: Final = {msg_type: code for code, msg_type in enumerate(_TYPE_BY_CODE)}
+
+
+@attrs.define(eq=False)
 class PlayerInfo:
-    """Information about a connected player."""
+    """Information about a connected player.
 
-    player_id: str
+    Compared by identity, since each player has exactly one instance per room,
+    updated in place.
+    """
+
+    player_id: str = attrs.field(on_setattr=attrs.setters.frozen)
     name: str
     is_ready: bool = False
     is_host: bool = False
@@ -66,6 +127,75 @@ class RoomInfo:
     game_type: str = "8ball"
     is_started: bool = False
 
+    # Bookkeeping derived from `players`, kept out of `to_dict`. Kept in step by
+    # `add_player`, `remove_player` and `set_ready`; call `reindex` after changing
+    # `players` any other way.
+    _cached_dict: dict[str, Any] | None = attrs.field(
+        default=None, init=False, repr=False, eq=False
+    )
+    _players_by_id: dict[str, PlayerInfo] = attrs.field(
+        factory=dict, init=False, repr=False, eq=False
+    )
+    ready_count: int = attrs.field(default=0, init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.reindex()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Equivalent to `attrs.asdict`, but cached until `invalidate` is called.
+
+        The result is shared between calls, so treat it as read-only.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = attrs.asdict(self, filter=_public_room_field)
+        return self._cached_dict
+
+    def invalidate(self) -> None:
+        """Drop the cached `to_dict`. Call after mutating the room or its players."""
+        self._cached_dict = None
+
+    def reindex(self) -> None:
+        """Rebuild the player index and ready count from `players`."""
+        self._players_by_id = {p.player_id: p for p in self.players}
+        self.ready_count = sum(p.is_ready for p in self.players)
+        self._cached_dict = None
+
+    def get_player(self, player_id: str) -> PlayerInfo | None:
+        return self._players_by_id.get(player_id)
+
+    def add_player(self, player: PlayerInfo) -> None:
+        self.players.append(player)
+        self._players_by_id[player.player_id] = player
+        self.ready_count += player.is_ready
+        self._cached_dict = None
+
+    def remove_player(self, player_id: str) -> PlayerInfo | None:
+        """Remove a player, keeping the others in join order."""
+        player = self._players_by_id.pop(player_id, None)
+        if player is None:
+            return None
+        for i, p in enumerate(self.players):
+            if p is player:
+                del self.players[i]
+                break
+        self.ready_count -= player.is_ready
+        self._cached_dict = None
+        return player
+
+    def set_ready(self, player_id: str, is_ready: bool) -> bool:
+        """Set a player's ready flag. Returns False if they aren't in the room."""
+        player = self._players_by_id.get(player_id)
+        if player is None:
+            return False
+        self.ready_count += is_ready - player.is_ready
+        player.is_ready = is_ready
+        self._cached_dict = None
+        return True
+
+    @property
+    def all_ready(self) -> bool:
+        return self.ready_count == len(self.players)
+
     @property
     def is_full(self) -> bool:
         return len(self.players) >= self.max_players
@@ -75,6 +205,10 @@ class RoomInfo:
         return len(self.players)
 
 
+def _public_room_field(attribute: attrs.Attribute, value: Any) -> bool:
+    return attribute.name not in ("_cached_dict", "_players_by_id", "ready_count")
+
+
 @attrs.define
 class CueState:
     """State of the cue stick for synchronization."""
@@ -86,6 +220,17 @@ class CueState:
     b: float  # English vertical
     cue_ball_id: str
 
+    def to_dict(self) -> dict[str, Any]:
+        """Equivalent to `attrs.asdict`, without its per-call field introspection."""
+        return {
+            "phi": self.phi,
+            "theta": self.theta,
+            "V0": self.V0,
+            "a": self.a,
+            "b": self.b,
+            "cue_ball_id": self.cue_ball_id,
+        }
+
 
 @attrs.define
 class GameState:
@@ -102,6 +247,23 @@ class GameState:
     is_game_over: bool = False
     winner_id: str | None = None
 
+    def apply_delta(self, delta: dict[str, Any]) -> None:
+        """Update in place from a TURN_CHANGE message's `state_delta`.
+
+        The delta's ball positions and states are only those that changed, and
+        are merged in, and balls it lists as removed are dropped. Its other fields
+        replace the current values.
+        """
+        self.ball_positions.update(delta.get("ball_positions", {}))
+        self.ball_states.update(delta.get("ball_states", {}))
+        for ball_id in delta.get("removed_positions", ()):
+            self.ball_positions.pop(ball_id, None)
+        for ball_id in delta.get("removed_states", ()):
+            self.ball_states.pop(ball_id, None)
+        self.turn_number = delta.get("turn_number", self.turn_number)
+        self.shot_number = delta.get("shot_number", self.shot_number)
+        self.score = delta.get("score", self.score)
+
 
 @attrs.define
 class GameMessage:
@@ -112,19 +274,56 @@ class GameMessage:
     data: dict[str, Any]
     timestamp: float
 
+    # The msgpack payload this message was decoded from, if any, see `forward_frame`
+    _payload: bytes | memoryview | None = attrs.field(
+        default=None, init=False, repr=False, eq=False
+    )
+
     def to_json(self) -> str:
         """Serialize message to JSON string."""
-        return json.dumps({
+        return self.to_bytes().decode()
+
+    def to_bytes(self) -> bytes:
+        """Serialize message to UTF-8 encoded JSON."""
+        return _dumps({
             "msg_type": self.msg_type.value,
             "sender_id": self.sender_id,
             "data": self.data,
             "timestamp": self.timestamp,
         })
 
+    def to_frame(self) -> bytes:
+        """Serialize message to a wire frame."""
+        return encode_frame(self.msg_type, self.sender_id, self.data, self.timestamp)
+
+    def forward_frame(self, sender_id: str, timestamp: float) -> bytes:
+        """Serialize message to a wire frame with a new sender and timestamp.
+
+        For relaying a received message unchanged: its data is copied over from the
+        frame it arrived in, rather than serialized again. `data` must not have been
+        modified since.
+        """
+        payload = self._payload
+        if payload is not None:
+            # Our own encoder's envelope head, which is what the data follows unless
+            # the peer encoded it differently
+            head = _envelope_prefix(self.sender_id) + msgpack.packb(self.timestamp)
+            if payload[: len(head)] == head:
+                packed_data = bytes(payload[len(head) :])
+                return encode_packed_frame(
+                    self.msg_type, sender_id, packed_data, timestamp
+                )
+        return encode_frame(self.msg_type, sender_id, self.data, timestamp)
+
     @classmethod
-    def from_json(cls, json_str: str) -> GameMessage:
+    def from_json(cls, json_str: str | bytes) -> GameMessage:
         """Deserialize message from JSON string."""
-        data = json.loads(json_str)
+        return cls.from_bytes(json_str)
+
+    @classmethod
+    def from_bytes(cls, raw: bytes | bytearray | memoryview | str) -> GameMessage:
+        """Deserialize message from UTF-8 encoded JSON (any bytes-like or str)."""
+        data = _loads(raw)
         return cls(
             msg_type=MessageType(data["msg_type"]),
             sender_id=data["sender_id"],
@@ -132,6 +331,60 @@ class GameMessage:
             timestamp=data["timestamp"],
         )
 
+    @classmethod
+    def from_frame_payload(
+        cls, kind: int, payload: bytes | bytearray | memoryview
+    ) -> GameMessage:
+        """Deserialize message from a frame's payload, given the frame's kind byte."""
+        if kind & FLAG_MSGPACK:
+            sender_id, timestamp, data = msgpack.unpackb(payload)
+        else:
+            sender_id, timestamp, data = _loads(payload)
+        message = cls(
+            msg_type=_TYPE_BY_CODE[kind & ~FLAG_MSGPACK],
+            sender_id=sender_id,
+            data=data,
+            timestamp=timestamp,
+        )
+        if kind & FLAG_MSGPACK:
+            message._payload = payload
+        return message
+
+
+@lru_cache(maxsize=128)
+def _envelope_prefix(sender_id: str) -> bytes:
+    # A 3-element msgpack array header (fixarray), then the sender ID
+    return b"\x93" + msgpack.packb(sender_id)
+
+
+def encode_frame(
+    msg_type: MessageType, sender_id: str, data: dict[str, Any], timestamp: float
+) -> bytes:
+    """Serialize a message straight to a wire frame.
+
+    Equivalent to `GameMessage(...).to_frame()`. The envelope head for a given
+    sender is encoded once and reused, so only the timestamp and `data` are
+    serialized per call.
+    """
+    return encode_packed_frame(msg_type, sender_id, pack_data(data), timestamp)
+
+
+def pack_data(data: dict[str, Any]) -> bytes:
+    """Serialize a message's data on its own, for `encode_packed_frame`."""
+    return msgpack.packb(data)
+
+
+def encode_packed_frame(
+    msg_type: MessageType, sender_id: str, packed_data: bytes, timestamp: float
+) -> bytes:
+    """Like `encode_frame`, for data already serialized with `pack_data`.
+
+    Lets senders of fixed messages serialize their data once and reuse it.
+    """
+    payload = _envelope_prefix(sender_id) + msgpack.packb(timestamp) + packed_data
+    kind = _CODE_BY_TYPE[msg_type] | FLAG_MSGPACK
+    return FRAME_HEADER.pack(kind, len(payload)) + payload
+
 
 def serialize_ball_positions(balls: dict) -> dict[str, tuple[float, float, float]]:
     """Extract ball positions from a balls dictionary."""
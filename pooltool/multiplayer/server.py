@@ -4,34 +4,112 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import ipaddress
 import logging
+import multiprocessing
+import os
+import secrets
+import socket
 import time
-import uuid
+from functools import lru_cache
 from typing import Callable
 
 import attrs
+import click
 
 from pooltool.multiplayer.protocol import (
+    FRAME_HEADER,
+    MAX_FRAME_SIZE,
+    PROTOCOL_VERSION,
     GameMessage,
     GameState,
     MessageType,
     PlayerInfo,
     RoomInfo,
+    encode_frame,
+    encode_packed_frame,
+    pack_data,
 )
 
+# uvloop is a drop-in, faster event loop for `run_server`. It's optional, with the
+# stdlib loop as fallback.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
+# Frames a client may have waiting to be sent before it's dropped as too slow to
+# keep up. Generous, since aim previews alone arrive at up to 60 Hz.
+OUTBOX_LIMIT = 512
+
+# Shortest time between aim preview broadcasts to a room. Aims arriving faster are
+# coalesced, latest wins.
+AIM_BROADCAST_INTERVAL = 1 / 30
+
+# Seconds a client may go without sending a complete frame before it's dropped.
+# Clients ping every few seconds, so only dead or stalling (slow-loris) peers hit it.
+IDLE_TIMEOUT = 30.0
+
 
-@attrs.define
+@attrs.define(eq=False)
 class ConnectedClient:
-    """Represents a connected client."""
+    """Represents a connected client.
 
-    client_id: str
-    writer: asyncio.StreamWriter
-    reader: asyncio.StreamReader
+    Compared by identity: each instance is one connection.
+    """
+
+    client_id: str = attrs.field(on_setattr=attrs.setters.frozen)
+    writer: asyncio.StreamWriter = attrs.field(on_setattr=attrs.setters.frozen)
+    reader: asyncio.StreamReader = attrs.field(on_setattr=attrs.setters.frozen)
     player_info: PlayerInfo
     room_id: str | None = None
+    # Second connection carrying the client's bulky messages, see `BULK_ATTACH`
+    bulk_token: str | None = None
+    bulk_writer: asyncio.StreamWriter | None = None
+    # Encoded frames waiting for `writer_task`, see `MultiplayerServer._write_loop`
+    outbox: asyncio.Queue[bytes] = attrs.field(
+        factory=lambda: asyncio.Queue(maxsize=OUTBOX_LIMIT)
+    )
+    writer_task: asyncio.Task | None = None
+    # When the last complete frame arrived, as `time.monotonic()`
+    last_seen: float = attrs.field(factory=time.monotonic)
+    # Peer IP address, for `MultiplayerServer.max_connections_per_ip`
+    peer_ip: str = ""
+
+
+def _is_loopback(ip: str) -> bool:
+    try:
+        return ipaddress.ip_address(ip).is_loopback
+    except ValueError:  # Not an IP address, e.g. a Unix socket peer
+        return False
+
+
+def _queue_frame(client: ConnectedClient, frame: bytes) -> None:
+    try:
+        client.outbox.put_nowait(frame)
+    except asyncio.QueueFull:
+        # Closing ends the client's read loop, which then disconnects it. Doing that
+        # here instead would change `room.players` mid-broadcast.
+        logger.warning(f"Dropping {client.client_id}: too far behind on sends")
+        client.writer.close()
+
+
+def _diff_entries(old: dict, new: dict) -> tuple[dict, list]:
+    """The entries of `new` that are missing from or different in `old`, and the keys
+    of `old` missing from `new`.
+    """
+    changed = {key: value for key, value in new.items() if old.get(key) != value}
+    removed = [key for key in old if key not in new]
+    return changed, removed
+
+
+@lru_cache(maxsize=32)
+def _packed_error(error_msg: str) -> bytes:
+    # Nearly every error is one of a few fixed messages, so serialize each just once
+    return pack_data({"error": error_msg})
 
 
 class MultiplayerServer:
@@ -50,14 +128,44 @@ class MultiplayerServer:
         host: str = "0.0.0.0",
         port: int = 7777,
         max_rooms: int = 100,
+        reuse_port: bool = False,
+        max_connections: int = 1024,
+        max_connections_per_ip: int = 8,
     ):
         self.host = host
         self.port = port
         self.max_rooms = max_rooms
+        # Connections past either cap are closed on arrival. `max_connections`
+        # counts sockets, so each client takes two, counting its bulk channel.
+        # `max_connections_per_ip` counts clients, and doesn't apply to loopback
+        # peers: a tunnel agent (ngrok) connects from localhost on behalf of every
+        # player coming through it.
+        self.max_connections = max_connections
+        self.max_connections_per_ip = max_connections_per_ip
+        # Lets several server processes listen on the same port, with the kernel
+        # spreading incoming connections between them (see `run_server`)
+        self.reuse_port = reuse_port
 
         self.clients: dict[str, ConnectedClient] = {}
         self.rooms: dict[str, RoomInfo] = {}
+        # The subset of `rooms` that can be joined (not started, not full), kept up
+        # to date by `_update_lobby` so room list requests needn't filter
+        self.lobby_rooms: dict[str, RoomInfo] = {}
         self.game_states: dict[str, GameState] = {}
+        # Bulk channel token -> ID of the client it was issued to
+        self._bulk_tokens: dict[str, str] = {}
+        # Open connections in total, and clients (`clients` entries) by peer IP
+        self._connection_count = 0
+        self._clients_by_ip: dict[str, int] = {}
+        # Room ID -> its players' clients, for broadcasts. Dropped whenever the
+        # room's players change, and rebuilt on the next broadcast.
+        self._room_recipients: dict[str, tuple[ConnectedClient, ...]] = {}
+
+        # Aim preview throttling, by room ID: the latest aim not yet broadcast (with
+        # its sender), the task that will broadcast it, and when the last went out
+        self._pending_aims: dict[str, tuple[str, GameMessage]] = {}
+        self._aim_flushes: dict[str, asyncio.Task] = {}
+        self._last_aim_broadcast: dict[str, float] = {}
 
         self._server: asyncio.Server | None = None
         self._running = False
@@ -80,26 +188,36 @@ class MultiplayerServer:
 
     async def start(self) -> None:
         """Start the server and begin accepting connections."""
+        # A buffer limit of a whole frame lets `readexactly` take even the largest
+        # frame without pausing and resuming the transport partway through
         self._server = await asyncio.start_server(
             self._handle_client,
             self.host,
             self.port,
+            limit=MAX_FRAME_SIZE,
+            reuse_port=self.reuse_port,
         )
         self._running = True
 
         addr = self._server.sockets[0].getsockname()
         logger.info(f"Multiplayer server started on {addr[0]}:{addr[1]}")
 
-        async with self._server:
-            await self._server.serve_forever()
+        reaper = asyncio.create_task(self._reap_idle_clients())
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            reaper.cancel()
 
     async def stop(self) -> None:
         """Stop the server and disconnect all clients."""
         self._running = False
 
-        # Disconnect all clients
-        for client in list(self.clients.values()):
-            await self._disconnect_client(client.client_id)
+        # Disconnect all clients, together so their closing handshakes overlap
+        await asyncio.gather(
+            *(self._disconnect_client(client_id) for client_id in list(self.clients)),
+            return_exceptions=True,
+        )
 
         if self._server:
             self._server.close()
@@ -107,16 +225,61 @@ class MultiplayerServer:
 
         logger.info("Multiplayer server stopped")
 
+    async def _reap_idle_clients(self) -> None:
+        """Periodically close connections that have gone quiet for `IDLE_TIMEOUT`.
+
+        One sweep for everyone, rather than a timeout on every read. Closing ends
+        the client's read loop, which disconnects it.
+        """
+        while True:
+            await asyncio.sleep(IDLE_TIMEOUT / 3)
+            cutoff = time.monotonic() - IDLE_TIMEOUT
+            for client in list(self.clients.values()):
+                if client.last_seen < cutoff:
+                    logger.warning(f"Dropping {client.client_id}: idle too long")
+                    client.writer.close()
+
     async def _handle_client(
         self,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
     ) -> None:
         """Handle a new client connection."""
-        client_id = str(uuid.uuid4())
+        addr = writer.get_extra_info("peername")
+        ip = addr[0] if addr else ""
+        if self._connection_count >= self.max_connections or (
+            not _is_loopback(ip)
+            and self._clients_by_ip.get(ip, 0) >= self.max_connections_per_ip
+        ):
+            logger.warning(f"Refused connection from {addr}: too many connections")
+            writer.close()
+            return
+
+        self._connection_count += 1
+        try:
+            await self._serve_client(reader, writer, ip)
+        finally:
+            self._connection_count -= 1
+
+    async def _serve_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        ip: str,
+    ) -> None:
+        """Read and process a connection's messages until it closes."""
+        client_id = secrets.token_hex(16)
         addr = writer.get_extra_info("peername")
         logger.info(f"New connection from {addr}, assigned ID: {client_id}")
 
+        # Aim previews are small frames sent back to back, which Nagle's algorithm
+        # would hold back waiting on ACKs. asyncio's own transports already disable
+        # it, but not every event loop does.
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            with contextlib.suppress(OSError):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
         # Create placeholder client entry
         player_info = PlayerInfo(
             player_id=client_id,
@@ -129,20 +292,47 @@ class MultiplayerServer:
             writer=writer,
             reader=reader,
             player_info=player_info,
+            peer_ip=ip,
         )
-        self.clients[client_id] = client
+        self._add_client(client)
+        client.writer_task = asyncio.create_task(self._write_loop(client))
+
+        # Set if this connection attaches as another client's bulk channel, after
+        # which its messages are processed as that client's
+        owner_id: str | None = None
 
         try:
             while self._running:
-                data = await reader.readline()
-                if not data:
+                try:
+                    header = await reader.readexactly(FRAME_HEADER.size)
+                    kind, length = FRAME_HEADER.unpack(header)
+                    if length > MAX_FRAME_SIZE:
+                        logger.warning(
+                            f"Dropping {client_id}: {length} byte frame is over the "
+                            f"{MAX_FRAME_SIZE} byte limit"
+                        )
+                        break
+                    payload = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
                     break
+                client.last_seen = time.monotonic()
 
                 try:
-                    message = GameMessage.from_json(data.decode().strip())
-                    await self._process_message(client_id, message)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Invalid JSON from {client_id}: {e}")
+                    message = GameMessage.from_frame_payload(kind, payload)
+                    if message.msg_type == MessageType.BULK_ATTACH:
+                        if owner_id is not None:
+                            logger.warning(
+                                f"Rejected second attach on bulk channel {client_id}"
+                            )
+                            break
+                        attached = await self._attach_bulk_channel(client_id, message)
+                        if attached is None:
+                            break
+                        owner_id = attached
+                        continue
+                    await self._process_message(owner_id or client_id, message)
+                except ValueError as e:
+                    logger.warning(f"Invalid message from {client_id}: {e}")
                 except Exception as e:
                     logger.error(f"Error processing message from {client_id}: {e}")
 
@@ -151,7 +341,68 @@ class MultiplayerServer:
         except ConnectionResetError:
             logger.info(f"Connection reset by {client_id}")
         finally:
-            await self._disconnect_client(client_id)
+            if owner_id is not None:
+                await self._detach_bulk_channel(owner_id, writer)
+            elif client_id in self.clients:
+                await self._disconnect_client(client_id)
+            else:
+                # No longer registered, so nothing else will close the connection
+                writer.close()
+                with contextlib.suppress(Exception):
+                    await writer.wait_closed()
+
+    async def _attach_bulk_channel(
+        self, client_id: str, message: GameMessage
+    ) -> str | None:
+        """Make connection `client_id` the bulk channel of the client owning the token.
+
+        Only a fresh connection can attach: one that has sent CONNECT is a client in
+        its own right (possibly the token's owner), and must stay one.
+
+        Returns:
+            The owning client's ID, or None if the attach is rejected.
+        """
+        token = message.data.get("token", "")
+        owner_id = self._bulk_tokens.get(token)
+        owner = self.clients.get(owner_id) if owner_id else None
+        if owner is None or owner.bulk_writer is not None:
+            logger.warning(f"Rejected bulk channel from {client_id}: invalid token")
+            return None
+        if owner_id == client_id or self.clients[client_id].bulk_token is not None:
+            logger.warning(f"Rejected bulk channel from connected client {client_id}")
+            return None
+        del self._bulk_tokens[token]
+
+        # The connection was registered as a client of its own on arrival
+        bulk = self._remove_client(client_id)
+        assert bulk is not None
+        if bulk.writer_task is not None:
+            bulk.writer_task.cancel()
+        owner.bulk_writer = bulk.writer
+        logger.info(f"Client {owner.client_id} attached a bulk channel")
+
+        ack = GameMessage(
+            msg_type=MessageType.BULK_ATTACH,
+            sender_id="server",
+            data={"success": True},
+            timestamp=time.time(),
+        )
+        await self._send_message(owner.client_id, ack)
+        return owner.client_id
+
+    async def _detach_bulk_channel(
+        self, owner_id: str, writer: asyncio.StreamWriter
+    ) -> None:
+        """Close a bulk channel; its owning client stays connected."""
+        owner = self.clients.get(owner_id)
+        if owner is not None and owner.bulk_writer is writer:
+            owner.bulk_writer = None
+
+        try:
+            writer.close()
+            await writer.wait_closed()
+        except Exception:
+            pass
 
     async def _process_message(self, client_id: str, message: GameMessage) -> None:
         """Process an incoming message from a client."""
@@ -166,14 +417,35 @@ class MultiplayerServer:
         if client_id not in self.clients:
             return
 
-        client = self.clients[client_id]
+        await self._send_raw(client_id, message.to_frame())
+
+    async def _send_raw(self, client_id: str, frame: bytes) -> None:
+        """Queue an already encoded frame for a specific client."""
+        client = self.clients.get(client_id)
+        if client is not None:
+            _queue_frame(client, frame)
+
+    async def _write_loop(self, client: ConnectedClient) -> None:
+        """Write a client's queued frames, one write and drain per batch.
+
+        Senders only queue, so a broadcast never waits on any one client's drain,
+        and whatever queues up during a drain goes out together in the next write.
+        The batch is handed over with `writelines`, which transports that support it
+        send with one scatter-gather `sendmsg` instead of joining the frames first.
+        """
+        outbox = client.outbox
         try:
-            data = message.to_json() + "\n"
-            client.writer.write(data.encode())
-            await client.writer.drain()
+            while True:
+                frames = [await outbox.get()]
+                while not outbox.empty():
+                    frames.append(outbox.get_nowait())
+                client.writer.writelines(frames)
+                await client.writer.drain()
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
-            logger.error(f"Error sending to {client_id}: {e}")
-            await self._disconnect_client(client_id)
+            logger.error(f"Error sending to {client.client_id}: {e}")
+            await self._disconnect_client(client.client_id)
 
     async def _broadcast_to_room(
         self,
@@ -185,20 +457,38 @@ class MultiplayerServer:
         if room_id not in self.rooms:
             return
 
-        room = self.rooms[room_id]
-        for player in room.players:
-            if player.player_id != exclude_client:
-                await self._send_message(player.player_id, message)
+        # Every recipient gets the same bytes, so encode them just once
+        await self._broadcast_frame(room_id, message.to_frame(), exclude_client)
+
+    async def _broadcast_frame(
+        self,
+        room_id: str,
+        frame: bytes,
+        exclude_client: str | None = None,
+    ) -> None:
+        """Broadcast an already encoded frame to all clients in a room."""
+        recipients = self._room_recipients.get(room_id)
+        if recipients is None:
+            room = self.rooms.get(room_id)
+            if room is None:
+                return
+            recipients = tuple(
+                self.clients[p.player_id]
+                for p in room.players
+                if p.player_id in self.clients
+            )
+            self._room_recipients[room_id] = recipients
+
+        for client in recipients:
+            if client.client_id != exclude_client:
+                _queue_frame(client, frame)
 
     async def _send_error(self, client_id: str, error_msg: str) -> None:
         """Send an error message to a specific client."""
-        message = GameMessage(
-            msg_type=MessageType.ERROR,
-            sender_id="server",
-            data={"error": error_msg},
-            timestamp=time.time(),
+        frame = encode_packed_frame(
+            MessageType.ERROR, "server", _packed_error(error_msg), time.time()
         )
-        await self._send_message(client_id, message)
+        await self._send_raw(client_id, frame)
 
     async def _disconnect_client(self, client_id: str) -> None:
         """Disconnect a client and clean up their resources."""
@@ -211,23 +501,67 @@ class MultiplayerServer:
         if client.room_id:
             await self._leave_room(client_id, client.room_id)
 
-        # Close connection
-        try:
-            client.writer.close()
-            await client.writer.wait_closed()
-        except Exception:
-            pass
-
-        del self.clients[client_id]
+        if client.bulk_token:
+            self._bulk_tokens.pop(client.bulk_token, None)
+
+        # Stop the writer (unless this is it, disconnecting after a failed write) and
+        # hand anything it hadn't got to yet to the transport, which flushes on close
+        if client.writer_task is not None:
+            if client.writer_task is not asyncio.current_task():
+                client.writer_task.cancel()
+            frames = []
+            while not client.outbox.empty():
+                frames.append(client.outbox.get_nowait())
+            if frames:
+                with contextlib.suppress(Exception):
+                    client.writer.writelines(frames)
+
+        # Close connection, and its bulk channel along with it
+        for writer in (client.writer, client.bulk_writer):
+            if writer is None:
+                continue
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+        self._remove_client(client_id)
         logger.info(f"Client {client_id} disconnected")
 
+    def _add_client(self, client: ConnectedClient) -> None:
+        self.clients[client.client_id] = client
+        ip = client.peer_ip
+        self._clients_by_ip[ip] = self._clients_by_ip.get(ip, 0) + 1
+
+    def _remove_client(self, client_id: str) -> ConnectedClient | None:
+        client = self.clients.pop(client_id, None)
+        if client is not None:
+            ip = client.peer_ip
+            remaining = self._clients_by_ip[ip] - 1
+            if remaining:
+                self._clients_by_ip[ip] = remaining
+            else:
+                del self._clients_by_ip[ip]
+        return client
+
+    def _update_lobby(self, room: RoomInfo) -> None:
+        """Bring `room`'s listing in `lobby_rooms` in line with its current state."""
+        if room.is_started or room.is_full:
+            self.lobby_rooms.pop(room.room_id, None)
+        else:
+            self.lobby_rooms[room.room_id] = room
+
     async def _leave_room(self, client_id: str, room_id: str) -> None:
         """Remove a client from a room."""
         if room_id not in self.rooms:
             return
 
         room = self.rooms[room_id]
-        room.players = [p for p in room.players if p.player_id != client_id]
+        # Join order is kept: the first player is the fallback host and takes the
+        # first turn
+        room.remove_player(client_id)
+        self._room_recipients.pop(room_id, None)
 
         if client_id in self.clients:
             self.clients[client_id].room_id = None
@@ -235,20 +569,25 @@ class MultiplayerServer:
         # If room is empty, delete it
         if not room.players:
             del self.rooms[room_id]
+            self.lobby_rooms.pop(room_id, None)
             if room_id in self.game_states:
                 del self.game_states[room_id]
+            self._drop_pending_aim(room_id)
+            self._last_aim_broadcast.pop(room_id, None)
             logger.info(f"Room {room_id} deleted (empty)")
         else:
             # If host left, assign new host
             if room.host_id == client_id:
                 room.host_id = room.players[0].player_id
                 room.players[0].is_host = True
+                room.invalidate()
+            self._update_lobby(room)
 
             # Notify remaining players
             update_msg = GameMessage(
                 msg_type=MessageType.ROOM_UPDATE,
                 sender_id="server",
-                data={"room": attrs.asdict(room)},
+                data={"room": room.to_dict()},
                 timestamp=time.time(),
             )
             await self._broadcast_to_room(room_id, update_msg)
@@ -257,8 +596,27 @@ class MultiplayerServer:
 
     async def _handle_connect(self, client_id: str, message: GameMessage) -> None:
         """Handle client connection request."""
+        version = message.data.get("protocol")
+        if version != PROTOCOL_VERSION:
+            await self._send_error(
+                client_id,
+                f"Incompatible game version (protocol {version}, server speaks "
+                f"{PROTOCOL_VERSION}). Please update.",
+            )
+            await self._disconnect_client(client_id)
+            return
+
         name = message.data.get("name", f"Player_{client_id[:8]}")
-        self.clients[client_id].player_info.name = name
+        client = self.clients[client_id]
+        client.player_info.name = name
+        if client.room_id and (room := self.rooms.get(client.room_id)):
+            room.invalidate()
+
+        # Lets the client open a bulk channel, see `_attach_bulk_channel`
+        if client.bulk_token:
+            self._bulk_tokens.pop(client.bulk_token, None)
+        client.bulk_token = secrets.token_hex(16)
+        self._bulk_tokens[client.bulk_token] = client_id
 
         response = GameMessage(
             msg_type=MessageType.CONNECT,
@@ -267,6 +625,8 @@ class MultiplayerServer:
                 "success": True,
                 "player_id": client_id,
                 "name": name,
+                "bulk_token": client.bulk_token,
+                "protocol": PROTOCOL_VERSION,
             },
             timestamp=time.time(),
         )
@@ -278,27 +638,21 @@ class MultiplayerServer:
 
     async def _handle_ping(self, client_id: str, message: GameMessage) -> None:
         """Handle ping message."""
-        response = GameMessage(
-            msg_type=MessageType.PONG,
-            sender_id="server",
-            data={"client_time": message.data.get("time", 0)},
-            timestamp=time.time(),
+        # Pings arrive from every client every few seconds, so skip the GameMessage
+        data = {"client_time": message.data.get("time", 0)}
+        await self._send_raw(
+            client_id, encode_frame(MessageType.PONG, "server", data, time.time())
         )
-        await self._send_message(client_id, response)
 
     async def _handle_create_room(self, client_id: str, message: GameMessage) -> None:
         """Handle room creation request."""
         if len(self.rooms) >= self.max_rooms:
-            error_msg = GameMessage(
-                msg_type=MessageType.ERROR,
-                sender_id="server",
-                data={"error": "Server is full. Cannot create more rooms."},
-                timestamp=time.time(),
+            await self._send_error(
+                client_id, "Server is full. Cannot create more rooms."
             )
-            await self._send_message(client_id, error_msg)
             return
 
-        room_id = str(uuid.uuid4())[:8]
+        room_id = secrets.token_hex(4)
         room_name = message.data.get("room_name", f"Room {room_id}")
         game_type = message.data.get("game_type", "8ball")
 
@@ -314,12 +668,13 @@ class MultiplayerServer:
             game_type=game_type,
         )
         self.rooms[room_id] = room
+        self._update_lobby(room)
         self.clients[client_id].room_id = room_id
 
         response = GameMessage(
             msg_type=MessageType.CREATE_ROOM,
             sender_id="server",
-            data={"success": True, "room": attrs.asdict(room)},
+            data={"success": True, "room": room.to_dict()},
             timestamp=time.time(),
         )
         await self._send_message(client_id, response)
@@ -330,48 +685,32 @@ class MultiplayerServer:
         room_id = message.data.get("room_id")
 
         if not room_id or room_id not in self.rooms:
-            error_msg = GameMessage(
-                msg_type=MessageType.ERROR,
-                sender_id="server",
-                data={"error": "Room not found."},
-                timestamp=time.time(),
-            )
-            await self._send_message(client_id, error_msg)
+            await self._send_error(client_id, "Room not found.")
             return
 
         room = self.rooms[room_id]
 
         if room.is_full:
-            error_msg = GameMessage(
-                msg_type=MessageType.ERROR,
-                sender_id="server",
-                data={"error": "Room is full."},
-                timestamp=time.time(),
-            )
-            await self._send_message(client_id, error_msg)
+            await self._send_error(client_id, "Room is full.")
             return
 
         if room.is_started:
-            error_msg = GameMessage(
-                msg_type=MessageType.ERROR,
-                sender_id="server",
-                data={"error": "Game already in progress."},
-                timestamp=time.time(),
-            )
-            await self._send_message(client_id, error_msg)
+            await self._send_error(client_id, "Game already in progress.")
             return
 
         player_info = self.clients[client_id].player_info
         player_info.is_host = False
         player_info.is_ready = False
-        room.players.append(player_info)
+        room.add_player(player_info)
+        self._room_recipients.pop(room_id, None)
+        self._update_lobby(room)
         self.clients[client_id].room_id = room_id
 
         # Notify the joining player
         response = GameMessage(
             msg_type=MessageType.JOIN_ROOM,
             sender_id="server",
-            data={"success": True, "room": attrs.asdict(room)},
+            data={"success": True, "room": room.to_dict()},
             timestamp=time.time(),
         )
         await self._send_message(client_id, response)
@@ -380,7 +719,7 @@ class MultiplayerServer:
         update_msg = GameMessage(
             msg_type=MessageType.ROOM_UPDATE,
             sender_id="server",
-            data={"room": attrs.asdict(room)},
+            data={"room": room.to_dict()},
             timestamp=time.time(),
         )
         await self._broadcast_to_room(room_id, update_msg, exclude_client=client_id)
@@ -403,11 +742,7 @@ class MultiplayerServer:
 
     async def _handle_room_list(self, client_id: str, message: GameMessage) -> None:
         """Handle room list request."""
-        room_list = [
-            attrs.asdict(room)
-            for room in self.rooms.values()
-            if not room.is_started and not room.is_full
-        ]
+        room_list = [room.to_dict() for room in self.lobby_rooms.values()]
 
         response = GameMessage(
             msg_type=MessageType.ROOM_LIST,
@@ -428,16 +763,13 @@ class MultiplayerServer:
             return
 
         is_ready = message.data.get("is_ready", True)
-        for player in room.players:
-            if player.player_id == client_id:
-                player.is_ready = is_ready
-                break
+        room.set_ready(client_id, bool(is_ready))
 
         # Notify all players in room
         update_msg = GameMessage(
             msg_type=MessageType.ROOM_UPDATE,
             sender_id="server",
-            data={"room": attrs.asdict(room)},
+            data={"room": room.to_dict()},
             timestamp=time.time(),
         )
         await self._broadcast_to_room(room.room_id, update_msg)
@@ -456,13 +788,12 @@ class MultiplayerServer:
             return
 
         # Only host can start the game
-        is_host = any(p.player_id == client_id and p.is_host for p in room.players)
-        if not is_host:
+        if room.host_id != client_id:
             await self._send_error(client_id, "Only the host can start the game")
             return
 
         # Check all players are ready
-        if not all(p.is_ready for p in room.players):
+        if not room.all_ready:
             await self._send_error(client_id, "All players must be ready")
             return
 
@@ -480,6 +811,8 @@ class MultiplayerServer:
             return
 
         room.is_started = True
+        room.invalidate()
+        self._update_lobby(room)
 
         # Initialize game state
         game_state = GameState(
@@ -499,7 +832,7 @@ class MultiplayerServer:
             msg_type=MessageType.GAME_START,
             sender_id="server",
             data={
-                "room": attrs.asdict(room),
+                "room": room.to_dict(),
                 "game_state": attrs.asdict(game_state),
                 "first_player_id": room.players[0].player_id,
             },
@@ -523,14 +856,43 @@ class MultiplayerServer:
         if game_state.current_player_id != client_id:
             return
 
-        # Broadcast aim update to other players
-        aim_msg = GameMessage(
-            msg_type=MessageType.SHOT_AIM,
-            sender_id=client_id,
-            data=message.data,
-            timestamp=time.time(),
-        )
-        await self._broadcast_to_room(room.room_id, aim_msg, exclude_client=client_id)
+        # Broadcast aim update to other players, at most every AIM_BROADCAST_INTERVAL
+        room_id = room.room_id
+        self._pending_aims[room_id] = (client_id, message)
+        if room_id in self._aim_flushes:
+            return
+
+        last = self._last_aim_broadcast.get(room_id, float("-inf"))
+        wait = last + AIM_BROADCAST_INTERVAL - time.monotonic()
+        if wait <= 0:
+            await self._flush_aim(room_id)
+        else:
+            self._aim_flushes[room_id] = asyncio.create_task(
+                self._flush_aim_later(room_id, wait)
+            )
+
+    async def _flush_aim_later(self, room_id: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        del self._aim_flushes[room_id]
+        await self._flush_aim(room_id)
+
+    async def _flush_aim(self, room_id: str) -> None:
+        """Broadcast a room's pending aim preview, if any."""
+        pending = self._pending_aims.pop(room_id, None)
+        if pending is None or room_id not in self.rooms:
+            return
+
+        client_id, aim = pending
+        self._last_aim_broadcast[room_id] = time.monotonic()
+        frame = aim.forward_frame(client_id, time.time())
+        await self._broadcast_frame(room_id, frame, exclude_client=client_id)
+
+    def _drop_pending_aim(self, room_id: str) -> None:
+        """Discard a room's pending aim preview, so it can't arrive after the shot."""
+        self._pending_aims.pop(room_id, None)
+        flush = self._aim_flushes.pop(room_id, None)
+        if flush is not None:
+            flush.cancel()
 
     async def _handle_shot_execute(self, client_id: str, message: GameMessage) -> None:
         """Handle shot execution."""
@@ -547,14 +909,11 @@ class MultiplayerServer:
         if game_state.current_player_id != client_id:
             return
 
+        self._drop_pending_aim(room.room_id)
+
         # Broadcast shot to all players
-        shot_msg = GameMessage(
-            msg_type=MessageType.SHOT_EXECUTE,
-            sender_id=client_id,
-            data=message.data,
-            timestamp=time.time(),
-        )
-        await self._broadcast_to_room(room.room_id, shot_msg)
+        frame = message.forward_frame(client_id, time.time())
+        await self._broadcast_frame(room.room_id, frame)
 
     async def _handle_shot_result(self, client_id: str, message: GameMessage) -> None:
         """Handle shot result and update game state."""
@@ -571,9 +930,17 @@ class MultiplayerServer:
         if game_state.current_player_id != client_id:
             return
 
-        # Update game state
-        game_state.ball_positions = message.data.get("ball_positions", {})
-        game_state.ball_states = message.data.get("ball_states", {})
+        # Update game state, noting which balls changed for the turn change below
+        ball_positions = message.data.get("ball_positions", {})
+        ball_states = message.data.get("ball_states", {})
+        moved, removed_positions = _diff_entries(
+            game_state.ball_positions, ball_positions
+        )
+        changed_states, removed_states = _diff_entries(
+            game_state.ball_states, ball_states
+        )
+        game_state.ball_positions = ball_positions
+        game_state.ball_states = ball_states
         game_state.score = message.data.get("score", game_state.score)
         game_state.shot_number += 1
 
@@ -601,12 +968,23 @@ class MultiplayerServer:
             game_state.current_player_id = next_player_id
             game_state.turn_number += 1
 
+            # Only what changed since the last turn change (or the game start, which
+            # sends the full state), see `GameState.apply_delta`. Most balls don't
+            # move on a given shot.
             turn_msg = GameMessage(
                 msg_type=MessageType.TURN_CHANGE,
                 sender_id="server",
                 data={
                     "next_player_id": next_player_id,
-                    "game_state": attrs.asdict(game_state),
+                    "state_delta": {
+                        "turn_number": game_state.turn_number,
+                        "shot_number": game_state.shot_number,
+                        "score": game_state.score,
+                        "ball_positions": moved,
+                        "ball_states": changed_states,
+                        "removed_positions": removed_positions,
+                        "removed_states": removed_states,
+                    },
                 },
                 timestamp=time.time(),
             )
@@ -630,15 +1008,71 @@ class MultiplayerServer:
         await self._broadcast_to_room(client.room_id, chat_msg)
 
 
-def run_server(host: str = "0.0.0.0", port: int = 7777) -> None:
-    """Run the multiplayer server."""
+def run_server(host: str = "0.0.0.0", port: int = 7777, workers: int = 1) -> None:
+    """Run the multiplayer server.
+
+    Args:
+        host: Address to listen on.
+        port: Port to listen on.
+        workers:
+            Number of server processes, all listening on the same port with
+            `SO_REUSEPORT` (Linux and BSDs only). 0 for one per CPU. Each worker
+            keeps its own clients and rooms, and the kernel picks the worker for
+            each new connection, so players can only see and join rooms on the
+            worker they landed on. Only use more than one where that's acceptable.
+    """
     logging.basicConfig(level=logging.INFO)
-    server = MultiplayerServer(host=host, port=port)
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        _serve(host, port, reuse_port=False)
+        return
+
+    # Spawned rather than forked, so no worker inherits a parent's event loop state
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_serve, args=(host, port, True), daemon=True)
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    logger.info(f"Started {workers} server workers on port {port}")
+
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        logger.info("Server shutdown requested")
+
+
+def _serve(host: str, port: int, reuse_port: bool) -> None:
+    logging.basicConfig(level=logging.INFO)
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    server = MultiplayerServer(host=host, port=port, reuse_port=reuse_port)
     try:
         asyncio.run(server.start())
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
 
 
+@click.command()
+@click.option(
+    "--host", default="0.0.0.0", show_default=True, help="Address to listen on"
+)
+@click.option("--port", default=7777, show_default=True, help="Port to listen on")
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    help="Server processes sharing the port (0 for one per CPU). Rooms aren't shared "
+    "between workers.",
+)
+def main(host, port, workers):
+    run_server(host=host, port=port, workers=workers)
+
+
 if __name__ == "__main__":
-    run_server()
+    main()
@@ -0,0 +1,78 @@
+import pytest
+
+from pooltool.multiplayer.protocol import (
+    FLAG_MSGPACK,
+    FRAME_HEADER,
+    GameMessage,
+    MessageType,
+    encode_frame,
+)
+
+
+def _split_frame(frame: bytes) -> tuple[int, bytes]:
+    kind, length = FRAME_HEADER.unpack_from(frame)
+    payload = frame[FRAME_HEADER.size :]
+    assert len(payload) == length
+    return kind, payload
+
+
+def _json_kind(msg_type: MessageType) -> int:
+    """The kind byte of a frame of this type with a JSON payload."""
+    kind, _ = _split_frame(encode_frame(msg_type, "p1", {}, 0.0))
+    return kind & ~FLAG_MSGPACK
+
+
+@pytest.mark.parametrize(
+    "msg_type, data",
+    [
+        (MessageType.CHAT_MESSAGE, {"message": "hello\nworld"}),
+        (
+            MessageType.SHOT_RESULT,
+            {
+                "ball_positions": {"cue": [0.5, 1.0, 0.028575]},
+                "ball_states": {"cue": "stationary"},
+                "score": {"p1": 0},
+                "next_player_id": "p2",
+                "is_game_over": False,
+                "winner_id": None,
+            },
+        ),
+    ],
+)
+def test_frame_round_trip(msg_type, data):
+    message = GameMessage(msg_type=msg_type, sender_id="p1", data=data, timestamp=1.5)
+
+    kind, payload = _split_frame(message.to_frame())
+    assert kind & FLAG_MSGPACK
+    assert GameMessage.from_frame_payload(kind, payload) == message
+    assert GameMessage.from_frame_payload(kind, memoryview(payload)) == message
+
+
+def test_json_payload_is_understood():
+    kind = _json_kind(MessageType.CHAT_MESSAGE)
+    payload = b'["p1",1.5,{"message":"hi"}]'
+
+    message = GameMessage.from_frame_payload(kind, payload)
+    assert message == GameMessage(
+        msg_type=MessageType.CHAT_MESSAGE,
+        sender_id="p1",
+        data={"message": "hi"},
+        timestamp=1.5,
+    )
+
+
+@pytest.mark.parametrize("received_as_json", [False, True])
+def test_forward_frame(received_as_json):
+    data = {"cue_state": {"phi": 90.0, "V0": 2.0, "cue_ball_id": "cue"}}
+    if received_as_json:
+        kind = _json_kind(MessageType.SHOT_AIM)
+        payload = b'["p1",1.5,{"cue_state":{"phi":90.0,"V0":2.0,"cue_ball_id":"cue"}}]'
+    else:
+        original = GameMessage(MessageType.SHOT_AIM, "p1", data, 1.5)
+        kind, payload = _split_frame(original.to_frame())
+    received = GameMessage.from_frame_payload(kind, payload)
+
+    kind, payload = _split_frame(received.forward_frame("server-id", 2.5))
+    assert GameMessage.from_frame_payload(kind, payload) == GameMessage(
+        msg_type=MessageType.SHOT_AIM, sender_id="server-id", data=data, timestamp=2.5
+    )
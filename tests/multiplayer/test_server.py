@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pooltool.multiplayer.server as server_module
+from pooltool.multiplayer.protocol import (
+    FRAME_HEADER,
+    PROTOCOL_VERSION,
+    GameMessage,
+    GameState,
+    MessageType,
+    encode_frame,
+)
+from pooltool.multiplayer.server import MultiplayerServer
+
+
+async def _start_server(**kwargs) -> tuple[MultiplayerServer, int, asyncio.Task]:
+    server = MultiplayerServer(host="127.0.0.1", port=0, **kwargs)
+    task = asyncio.create_task(server.start())
+    while not server._running:
+        await asyncio.sleep(0.01)
+    port = server._server.sockets[0].getsockname()[1]
+    return server, port, task
+
+
+class _Peer:
+    """A bare protocol-level connection to the server."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, port: int) -> _Peer:
+        return cls(*await asyncio.open_connection("127.0.0.1", port))
+
+    def send(self, msg_type: MessageType, data: dict[str, Any]) -> None:
+        self.writer.write(encode_frame(msg_type, "", data, 0.0))
+
+    async def receive(self) -> GameMessage:
+        header = await asyncio.wait_for(self.reader.readexactly(FRAME_HEADER.size), 2)
+        kind, length = FRAME_HEADER.unpack(header)
+        payload = await asyncio.wait_for(self.reader.readexactly(length), 2)
+        return GameMessage.from_frame_payload(kind, payload)
+
+    async def closed_by_server(self) -> bool:
+        return await asyncio.wait_for(self.reader.read(), 2) == b""
+
+    async def connect(self) -> GameMessage:
+        self.send(MessageType.CONNECT, {"name": "p", "protocol": PROTOCOL_VERSION})
+        return await self.receive()
+
+
+def test_self_attach_is_rejected_without_leaving_a_ghost():
+    async def scenario():
+        server, port, task = await _start_server()
+        peer = await _Peer.open(port)
+        token = (await peer.connect()).data["bulk_token"]
+        peer.send(MessageType.CREATE_ROOM, {"room_name": "R"})
+        await peer.receive()
+
+        # Its own token, on its own main connection
+        peer.send(MessageType.BULK_ATTACH, {"token": token})
+        assert await peer.closed_by_server()
+        await asyncio.sleep(0.05)
+        assert server.clients == {}
+        assert server.rooms == {}
+        assert server.lobby_rooms == {}
+        task.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_second_attach_on_a_bulk_channel_closes_it():
+    async def scenario():
+        server, port, task = await _start_server()
+        owner = await _Peer.open(port)
+        connected = (await owner.connect()).data
+        bulk = await _Peer.open(port)
+        bulk.send(MessageType.BULK_ATTACH, {"token": connected["bulk_token"]})
+        assert (await owner.receive()).msg_type == MessageType.BULK_ATTACH
+
+        bulk.send(MessageType.BULK_ATTACH, {"token": "bogus"})
+        assert await bulk.closed_by_server()
+        await _wait_for(lambda: server._connection_count == 1)
+        assert server.clients[connected["player_id"]].bulk_writer is None
+        task.cancel()
+
+    asyncio.run(scenario())
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def test_connections_over_the_cap_are_refused():
+    async def scenario():
+        server, port, task = await _start_server(max_connections=2)
+        peers = [await _Peer.open(port) for _ in range(3)]
+        assert await peers[2].closed_by_server()
+        for peer in peers[:2]:
+            assert (await peer.connect()).data["success"]
+        assert len(server.clients) == 2
+        task.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_per_ip_cap_counts_clients_not_bulk_channels(monkeypatch):
+    monkeypatch.setattr(server_module, "_is_loopback", lambda ip: False)
+
+    async def scenario():
+        server, port, task = await _start_server(max_connections_per_ip=2)
+        first = await _Peer.open(port)
+        token = (await first.connect()).data["bulk_token"]
+        bulk = await _Peer.open(port)
+        bulk.send(MessageType.BULK_ATTACH, {"token": token})
+        assert (await first.receive()).msg_type == MessageType.BULK_ATTACH
+
+        # The attached bulk channel gave its slot back
+        second = await _Peer.open(port)
+        assert (await second.connect()).data["success"]
+        third = await _Peer.open(port)
+        assert await third.closed_by_server()
+        task.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_loopback_peers_are_not_capped_per_ip():
+    async def scenario():
+        server, port, task = await _start_server(max_connections_per_ip=1)
+        peers = [await _Peer.open(port) for _ in range(3)]
+        for peer in peers:
+            assert (await peer.connect()).data["success"]
+        task.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_idle_clients_are_reaped(monkeypatch):
+    monkeypatch.setattr(server_module, "IDLE_TIMEOUT", 0.3)
+
+    async def scenario():
+        server, port, task = await _start_server()
+        idle = await _Peer.open(port)
+        active = await _Peer.open(port)
+        await active.connect()
+        for _ in range(4):
+            await asyncio.sleep(0.1)
+            active.send(MessageType.PING, {})
+            await active.receive()
+
+        assert await idle.closed_by_server()
+        await _wait_for(lambda: len(server.clients) == 1)
+        task.cancel()
+
+    asyncio.run(scenario())
+
+
+async def _receive_until(peer: _Peer, msg_type: MessageType) -> GameMessage:
+    while (message := await peer.receive()).msg_type != msg_type:
+        pass
+    return message
+
+
+def test_turn_change_deltas_reproduce_the_server_state():
+    async def scenario():
+        server, port, task = await _start_server()
+        host, guest = await _Peer.open(port), await _Peer.open(port)
+        host_id = (await host.connect()).data["player_id"]
+        guest_id = (await guest.connect()).data["player_id"]
+        host.send(MessageType.CREATE_ROOM, {"room_name": "R"})
+        room_id = (await host.receive()).data["room"]["room_id"]
+        guest.send(MessageType.JOIN_ROOM, {"room_id": room_id})
+        await guest.receive()
+        guest.send(MessageType.PLAYER_READY, {"is_ready": True})
+        await _receive_until(guest, MessageType.ROOM_UPDATE)
+        host.send(MessageType.GAME_START, {})
+        start = await _receive_until(guest, MessageType.GAME_START)
+        replica = GameState(**start.data["game_state"])
+
+        shots = [
+            (
+                host,
+                {
+                    "ball_positions": {"cue": [0.5, 0.5, 0.0], "1": [1.0, 0.5, 0.0]},
+                    "ball_states": {"cue": "on_table", "1": "on_table"},
+                    "score": {host_id: 0, guest_id: 0},
+                    "next_player_id": guest_id,
+                },
+            ),
+            # The 1 ball is dropped and the cue ball moves
+            (
+                guest,
+                {
+                    "ball_positions": {"cue": [0.7, 0.4, 0.0]},
+                    "ball_states": {"cue": "on_table"},
+                    "score": {host_id: 0, guest_id: 1},
+                    "next_player_id": host_id,
+                },
+            ),
+        ]
+        for shooter, result in shots:
+            shooter.send(MessageType.SHOT_RESULT, result)
+            turn = await _receive_until(guest, MessageType.TURN_CHANGE)
+            replica.apply_delta(turn.data["state_delta"])
+
+        expected = server.game_states[room_id]
+        assert replica.ball_positions == expected.ball_positions
+        assert replica.ball_states == expected.ball_states
+        assert replica.turn_number == expected.turn_number == 2
+        assert replica.shot_number == expected.shot_number == 2
+        assert replica.score == expected.score
+        task.cancel()
+
+    asyncio.run(scenario())